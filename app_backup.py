@@ -11,7 +11,7 @@ import streamlit as st
 import requests
 from crewai import Agent, Task, Crew, LLM, Process
 import os
-from crewai_tools import ScrapeWebsiteTool, SerperDevTool, FileReadTool, DirectoryReadTool
+from crewai_tools import ScrapeWebsiteTool, FileReadTool, DirectoryReadTool
 from streamlit_geolocation import streamlit_geolocation
 from dotenv import load_dotenv
 import base64
@@ -21,11 +21,16 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import json
+import hashlib
 import re
 from datetime import datetime, timedelta
 from langchain_openai import ChatOpenAI
 from pathlib import Path
-from tools.gethospitals import HospitalSearchByCoordinatesTool
+from services.http_pool import install_http_pool
+from tools.resilient_search import ResilientSerperDevTool
+from tools.gethospitals import HospitalSearchByCoordinatesTool, expanding_ring_search
+from tools.hospital_ranking import build_recommendations
+from tools.hospital_models import RecommendationReasons, parse_model
 
 
 # Load environment variables
@@ -33,6 +38,9 @@ load_dotenv()
 os.environ["SERPER_API_KEY"] = os.getenv("SERPER_API_KEY")
 os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
 
+# Share keep-alive connection pools between all tools and the LLM client
+install_http_pool()
+
 # Create output directory if it doesn't exist
 output_dir = Path("task_outputs")
 output_dir.mkdir(exist_ok=True)
@@ -292,6 +300,64 @@ def parse_markdown_content(filename):
             "patient_education": "Error parsing patient education materials."
         }
 
+# Hospital counts above which map markers are clustered
+MAP_CLUSTER_THRESHOLD = 15
+
+# Function to build the hospital map HTML, memoized by a hash of the results
+@st.cache_data(max_entries=64, show_spinner=False)
+def hospital_map_html(results_hash, _results):
+    import folium
+    from folium.plugins import MarkerCluster
+
+    user_coords = _results.get('user_coordinates', [17.32906, 78.618408])  # Default coordinates if not available
+    m = folium.Map(location=_results.get('map_center', user_coords), zoom_start=13)
+    
+    # Add user marker
+    folium.Marker(
+        location=user_coords,
+        popup="Your Location",
+        icon=folium.Icon(color="blue", icon="user")
+    ).add_to(m)
+    
+    # Cluster large result sets; markercluster indexes markers spatially and
+    # only adds those inside the visible bounds, in chunks
+    hospitals = [h for h in _results.get('hospitals', []) if h.get('latitude') and h.get('longitude')]
+    layer = m
+    if len(hospitals) > MAP_CLUSTER_THRESHOLD:
+        layer = MarkerCluster(
+            name="Hospitals",
+            options={"chunkedLoading": True, "removeOutsideVisibleBounds": True}
+        ).add_to(m)
+    
+    # Add hospital markers
+    for hospital in hospitals:
+        folium.Marker(
+            location=[hospital['latitude'], hospital['longitude']],
+            popup=f"<strong>{hospital.get('name', 'Hospital')}</strong><br>"
+                f"Rating: {'⭐' * hospital.get('rating', 0)}<br>"
+                f"{hospital.get('address', '')}",
+            icon=folium.Icon(color="red" if hospital.get('emergency') else "green", icon="hospital")
+        ).add_to(layer)
+    
+    return m._repr_html_()
+
+# Function to draw hospital results on a map
+def render_hospital_map(results, container=None):
+    # Only the fields drawn on the map go into the cache key
+    map_fields = {
+        "user_coordinates": results.get('user_coordinates'),
+        "map_center": results.get('map_center'),
+        "hospitals": [
+            [h.get('name'), h.get('address'), h.get('latitude'), h.get('longitude'), h.get('rating'), h.get('emergency')]
+            for h in results.get('hospitals', [])
+        ]
+    }
+    results_hash = hashlib.sha256(json.dumps(map_fields, sort_keys=True, default=str).encode()).hexdigest()
+    
+    # Display the map
+    with container or st.container():
+        st.components.v1.html(hospital_map_html(results_hash, results), height=400)
+
 # Function to generate prescription document
 def generate_prescription(patient_name, gender, age, diagnosis, medications, doctor_name="AI Doctor Assistant"):
     prescription = f"""
@@ -458,11 +524,13 @@ with st.sidebar:
     st.markdown("*Disclaimer: This tool is for informational purposes only and does not replace professional medical advice.*")
 
 # Initialize Tools
-search_tool = SerperDevTool()
+search_tool = ResilientSerperDevTool()
 scrape_tool = ScrapeWebsiteTool()
 file_tool = FileReadTool()
 directory_tool = DirectoryReadTool()
 hospital_search_tool = HospitalSearchByCoordinatesTool()
+# Candidates fetched before ranking, so the slider limit applies to the ranked list
+HOSPITAL_CANDIDATE_POOL = 20
 
 # Initialize LLM
 # llm = LLM(model="openai/gpt-4o-mini", temperature=0.7, api_key=os.environ["OPENAI_API_KEY"])
@@ -569,32 +637,6 @@ safety_officer = Agent(
 
 
 
-hospital_locator_agent = Agent(
-    role="Hospital Locator Specialist",
-    goal="Find the nearest hospitals and emergency care facilities based on location coordinates",
-    backstory="""You are an expert in geographic medical resource location. You use precise coordinates
-    to identify the closest medical facilities with emergency capabilities. You understand hospital ratings,
-    specialties, and can filter results based on specific medical needs.""",
-    llm=llm,
-    verbose=True,
-    allow_delegation=False,
-    max_iter=2,
-    tools=[hospital_search_tool,search_tool,scrape_tool]  # Using your custom tool
-)
-
-hospital_evaluator_agent = Agent(
-    role="Hospital Quality Evaluator",
-    goal="Assess and rank hospitals based on quality metrics and patient outcomes",
-    backstory="""You specialize in evaluating hospital quality using metrics like patient outcomes,
-    infection rates, and specialty certifications. You can identify the best hospitals for specific
-    medical conditions and emergency care.""",
-    llm=llm,
-    verbose=True,
-    allow_delegation=False,
-    max_iter=2,
-    tools=[search_tool, scrape_tool]  # For additional research if needed
-)
-
 patient_navigator_agent = Agent(
     role="Patient Navigation Specialist",
     goal="Help patients choose the most appropriate hospital based on their specific needs",
@@ -1817,12 +1859,10 @@ elif page == "Medical Knowledge":
 
 elif page == "Find Nearby Hospitals":
     st.markdown("<h1 class='main-header'>Find Nearby Hospitals</h1>", unsafe_allow_html=True)
-    st.markdown("<p class='sub-header'>AI-Powered Hospital Location and Evaluation System</p>", unsafe_allow_html=True)
-    if os.path.exists("hospital_recommendations.md"):
-        try:
-            os.remove("hospital_recommendations.md")
-        except Exception as e:
-            pass
+    st.markdown("<p class='sub-header'>Hospital Location and Ranking System</p>", unsafe_allow_html=True)
+    # Ranked results live in this session only; reruns render them from memory
+    if "hospital_results" not in st.session_state:
+        st.session_state.hospital_results = None
 
     def get_auto_location():
         try:
@@ -1835,100 +1875,30 @@ elif page == "Find Nearby Hospitals":
         except Exception as e:
             st.error(f"Error getting automatic location: {str(e)}")
             return None
+    # Optional free-text reasoning for the already ranked top picks
+    def add_ai_reasoning(recommendations, specialty):
+        reasoning_task = Task(
+            description=f"""For each recommended hospital below, write one or two sentences
+            explaining to a patient why it is a good choice{f' for {specialty}' if specialty != 'None' else ''}.
+            Do not change the order or invent facts that are not in the data.
+            Hospitals: {json.dumps([rec.model_dump() for rec in recommendations])}""",
+            agent=patient_navigator_agent,
+            expected_output='A JSON object {"reasons": {"Hospital Name": "reasoning"}} with one entry per hospital',
+            output_pydantic=RecommendationReasons
+        )
+        Crew(agents=[patient_navigator_agent], tasks=[reasoning_task], verbose=True).kickoff()
+        parsed = parse_model(RecommendationReasons, reasoning_task.output)
+        if parsed is None:
+            return recommendations
+        return [
+            rec.model_copy(update={"reasoning": parsed.reasons.get(rec.name) or rec.reasoning})
+            for rec in recommendations
+        ]
+
     # Create a container with tabs
     tab_auto, tab_manual = st.tabs(["Auto-Detect Location", "Enter Manually"])
     latitude, longitude = None, None
 
-    hospital_search_task = Task(
-                        description="""1. Use the provided coordinates (latitude: {latitude}, longitude: {longitude})
-                        2. Search for hospitals within {radius} miles (converted to meters)
-                        3. Identify hospitals with emergency services if required
-                        4. Validate all results have required fields (name, address, coordinates)
-                        5. Return standardized hospital data including:
-                        - name
-                        - address
-                        - phone
-                        - distance
-                        - emergency status
-                        - latitude/longitude
-                        6. Return error message if search fails""",
-                        agent=hospital_locator_agent,
-                        expected_output="""{
-                            "hospitals": [{
-                                "name": string,
-                                "address": string,
-                                "phone": string,
-                                "distance": string,
-                                "emergency": boolean,
-                                "latitude": float,
-                                "longitude": float
-                            }],
-                            "user_coordinates": [float, float],
-                            "search_radius": int,
-                            "status": "success"|"error",
-                            "message": string (if error),
-                            "count": int
-                        }""",
-                    )
-    hospital_evaluation_task = Task(
-                        description="""1. Validate the input data structure
-                        2. If status is "error", propagate the error message
-                        3. For each hospital, research quality metrics (simulated)
-                        4. Assign a rating (1-5 stars) based on:
-                        - Emergency capability
-                        - Available specialties
-                        - Distance from patient
-                        5. Identify any notable strengths
-                        6. Return enhanced hospital data""",
-                        agent=hospital_evaluator_agent,
-                        expected_output="""{
-                            "hospitals": [{
-                                ...original_fields,
-                                "rating": int (1-5),
-                                "specialties": [string],
-                                "strengths": [string]
-                            }],
-                            "user_coordinates": [float, float],
-                            "status": "success"|"error",
-                            "message": string (if error)
-                        }""",
-                        context=[hospital_search_task],
-                    )
-
-    patient_navigation_task = Task(
-                        description="""1. Validate the input data structure
-                        2. If status is "error", format a user-friendly error message
-                        3. Sort hospitals by rating then distance
-                        4. Select top 3 recommendations
-                        5. For each recommendation, provide clear reasoning
-                        6. Format the output for display with:
-                        - Map visualization data
-                        - Detailed hospital cards
-                        - Emergency service highlights
-                        7. Ensure all phone numbers are properly formatted""",
-                        agent=patient_navigator_agent,
-                        expected_output="""{
-                            "hospitals": [{
-                                ...all previous fields
-                            }],
-                            "recommendations": [{
-                                "name": string,
-                                "address": string,
-                                "distance": string,
-                                "reasoning": string,
-                                "latitude": float,
-                                "longitude": float
-                            }],
-                            "user_coordinates": [float, float],
-                            "status": "success"|"error",
-                            "message": string (if error),
-                            "map_center": [float, float],
-                            "search_radius": int
-                        }""",
-                        context=[hospital_evaluation_task],
-                        output_file="hospital_recommendations.md"
-                    )
-    
     with tab_auto:
         st.markdown("### Automatic Location Detection")
         if st.button("Detect My Location"):
@@ -1974,31 +1944,60 @@ elif page == "Find Nearby Hospitals":
     specialty = st.selectbox("Looking for specific specialty? (Optional)", 
                                ["None", "Cardiology", "Pediatrics", "Trauma", "Oncology", "Neurology"])
         
+    use_ai_reasoning = st.checkbox("Add AI-written reasoning to the top recommendations", value=False)
+        
+    progressive = st.checkbox("Show the nearest hospitals first (expanding search)", value=emergency_only,
+                              help="Searches a small radius first and widens it until enough hospitals are found")
+        
     if st.button("Search Hospitals"):
-            with st.spinner("AI Agents are analyzing hospital options..."):
+            with st.spinner("Finding and ranking hospital options..."):
                 try:
                     # Convert miles to meters (1 mile = 1609.34 meters)
                     radius_meters = int(radius * 1609.34)
-                    # Add these tasks with your existing task definitions (around line 500)
-
-                    # Create hospital search crew
-                    hospital_crew = Crew(
-                        agents=[hospital_locator_agent, hospital_evaluator_agent, patient_navigator_agent],
-                        tasks=[hospital_search_task, hospital_evaluation_task, patient_navigation_task],
-                        verbose=True,
-                        process=Process.sequential
-                    )
+                    search_specialty = None if specialty == "None" else specialty
                     
-                    # Set context for tasks
-                    hospital_search_task.description = hospital_search_task.description.format(
-                        latitude=latitude,
-                        longitude=longitude,
-                        radius=radius
-                    )
+                    def rank(search_result):
+                        return build_recommendations(
+                            search_result,
+                            radius_miles=radius,
+                            specialty=specialty,
+                            emergency_only=emergency_only,
+                            limit=limit
+                        )
                     
-                    # Run the crew
-                    result = hospital_crew.kickoff()
-
+                    # Search directly and rank locally; ranking is arithmetic, not an LLM job
+                    if progressive:
+                        # Show each ring's hospitals as soon as it is answered
+                        ring_status = st.empty()
+                        ring_map = st.empty()
+                        for search_result in expanding_ring_search(
+                            hospital_search_tool, latitude, longitude, radius_meters, limit, search_specialty,
+                            emergency_only=emergency_only, pool=HOSPITAL_CANDIDATE_POOL
+                        ):
+                            results = rank(search_result)
+                            if search_result["final"]:
+                                break
+                            ring_status.info(
+                                f"Found {len(results.hospitals)} hospital(s) within "
+                                f"{search_result['ring'] / 1609.34:.1f} miles, widening the search..."
+                            )
+                            render_hospital_map(results.model_dump(), ring_map)
+                        ring_status.empty()
+                        ring_map.empty()
+                    else:
+                        results = rank(hospital_search_tool.run(
+                            latitude=latitude,
+                            longitude=longitude,
+                            radius=radius_meters,
+                            limit=HOSPITAL_CANDIDATE_POOL,
+                            specialty=search_specialty,
+                            emergency_only=emergency_only
+                        ))
+                    
+                    if use_ai_reasoning and results.recommendations:
+                        results.recommendations = add_ai_reasoning(results.recommendations, specialty)
+                    
+                    st.session_state.hospital_results = results
                 
                 except Exception as e:
                     st.error(f"An error occurred: {str(e)}")
@@ -2040,22 +2039,19 @@ elif page == "Find Nearby Hospitals":
     #         except Exception as e:
     #             st.error(f"An error occurred: {str(e)}")
 # 17.330603, 78.621906
-    try:
-        with open("hospital_recommendations.md", "r") as f:
-            content = f.read()
-            # Extract JSON from the file (assuming it's the only content)
-            try:
-                results = json.loads(content)
-            except json.JSONDecodeError:
-                st.error("Could not parse hospital recommendations file")
-                st.stop()
-    except FileNotFoundError:
-        pass
+    hospital_results = st.session_state.hospital_results
     
     try:
-    # Check if data is valid
-        if not isinstance(results, dict) or 'hospitals' not in results:
-            st.error("Invalid hospital recommendations format")
+        # Nothing searched yet in this session
+        if hospital_results is None:
+            st.stop()
+        results = hospital_results.model_dump()
+        
+        if results.get('status') == 'error':
+            st.error(results.get('message', 'Hospital search failed'))
+            st.stop()
+        if not results['hospitals']:
+            st.info("No hospitals matched your filters within this radius. Try a larger radius or fewer filters.")
             st.stop()
         
         # Get coordinates for map center
@@ -2065,7 +2061,7 @@ elif page == "Find Nearby Hospitals":
         
         # Display the top 3 recommendations first
         if results.get('recommendations'):
-            st.markdown("#### 🏆 AI Recommendations")
+            st.markdown("#### 🏆 Top Recommendations")
             cols = st.columns(3)
             for i, rec in enumerate(results['recommendations'][:3]):
                 with cols[i]:
@@ -2096,36 +2092,13 @@ elif page == "Find Nearby Hospitals":
         # Create a map centered on user location
         st.divider()
         st.markdown(f"### Hospitals within {search_radius} miles")
-        import folium
-
-        m = folium.Map(location=map_center, zoom_start=13)
-        
-        # Add user marker
-        folium.Marker(
-            location=user_coords,
-            popup="Your Location",
-            icon=folium.Icon(color="blue", icon="user")
-        ).add_to(m)
-        
-        # Add hospital markers
-        for hospital in results.get('hospitals', []):
-            if hospital.get('latitude') and hospital.get('longitude'):
-                folium.Marker(
-                    location=[hospital['latitude'], hospital['longitude']],
-                    popup=f"<strong>{hospital.get('name', 'Hospital')}</strong><br>"
-                        f"Rating: {'⭐' * hospital.get('rating', 0)}<br>"
-                        f"{hospital.get('address', '')}",
-                    icon=folium.Icon(color="red" if hospital.get('emergency') else "green", icon="hospital")
-                ).add_to(m)
-        
-        # Display the map
-        st.components.v1.html(m._repr_html_(), height=400)
+        render_hospital_map(results)
         
         # Display all hospitals in expandable sections
         st.markdown("#### All Nearby Hospitals")
         
-        # Sort hospitals by rating (highest first)
-        sorted_hospitals = sorted(results.get('hospitals', []), key=lambda x: x.get('rating', 0), reverse=True)
+        # Hospitals arrive already ranked by weighted score
+        sorted_hospitals = results.get('hospitals', [])
         
         for hospital in sorted_hospitals:
             emergency_status = "🟢 24/7 Emergency" if hospital.get('emergency') else "🔴 No Emergency"
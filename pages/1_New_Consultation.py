@@ -0,0 +1,280 @@
+import services.sqlite_compat  # Must run before anything imports sqlite3
+
+import streamlit as st
+import time
+from datetime import datetime
+from services.jobs import make_job_id
+from services.registry import (
+    LLM_MODEL, get_consultation_agents, get_consultation_store, get_job_manager, get_llm, get_llm_cache,
+    get_results_bus
+)
+from ui.consultation import (
+    CONSULTATION_FORM_DEFAULTS, CONSULTATION_SECTIONS, extract_medications, generate_prescription,
+    render_consultation_sections, render_live_output, render_task_status, save_task_output
+)
+from ui.layout import setup_page, profile_page
+
+setup_page()
+
+with profile_page("New Consultation"):
+    st.markdown("<h1 class='main-header'>New Patient Consultation</h1>", unsafe_allow_html=True)
+    st.markdown("<p class='sub-header'>Multi-Agent Medical Intelligence Analysis</p>", unsafe_allow_html=True)
+    
+    # Inputs are batched in a form: editing a field does not rerun the page,
+    # and the crew is only built once an analysis is submitted.
+    # The last submitted values are kept as a draft for this session. Widgets
+    # in a form cannot save on change, so the page says when the draft is saved.
+    draft = st.session_state.setdefault("consultation_draft", dict(CONSULTATION_FORM_DEFAULTS))
+    form = {}
+    
+    with st.form("consultation_form"):
+        # Patient information form
+        st.subheader("Patient Information")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            form["patient_name"] = st.text_input('Patient Name', value=draft["patient_name"], placeholder='Full Name')
+        with col2:
+            genders = ['Male', 'Female', 'Other']
+            form["gender"] = st.selectbox('Gender', genders, index=genders.index(draft["gender"]))
+        with col3:
+            form["age"] = st.number_input('Age', min_value=0, max_value=120, value=draft["age"])
+        with col4:
+            form["weight_kg"] = st.number_input('Weight (kg)', min_value=0, max_value=500, value=draft["weight_kg"])
+        
+        # Tabs for different types of information
+        tab1, tab2, tab3, tab4 = st.tabs(["Symptoms & History", "Vital Signs", "Lab Results", "Additional Information"])
+        
+        with tab1:
+            form["symptoms"] = st.text_area('Presenting Symptoms', value=draft["symptoms"], placeholder='e.g., fever, cough, headache, fatigue', height=150)
+            form["symptom_duration"] = st.text_input('Symptom Duration', value=draft["symptom_duration"], placeholder='e.g., 3 days, 2 weeks')
+            form["medical_history"] = st.text_area('Medical History', value=draft["medical_history"], placeholder='e.g., diabetes, hypertension, past surgeries', height=150)
+            form["family_history"] = st.text_input('Family History', value=draft["family_history"], placeholder='e.g., heart disease, cancer')
+            form["medications"] = st.text_area('Current Medications', value=draft["medications"], placeholder='e.g., lisinopril 10mg daily, metformin 500mg twice daily', height=100)
+            form["allergies"] = st.text_area('Allergies', value=draft["allergies"], placeholder='e.g., penicillin, latex, peanuts', height=75)
+        
+        with tab2:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                form["temperature"] = st.number_input('Temperature (°C)', min_value=30.0, max_value=45.0, value=draft["temperature"], step=0.1)
+            with col2:
+                form["heart_rate"] = st.number_input('Heart Rate (bpm)', min_value=30, max_value=250, value=draft["heart_rate"])
+            with col3:
+                form["sys_bp"] = st.number_input('Systolic BP (mmHg)', min_value=50, max_value=250, value=draft["sys_bp"])
+            with col4:
+                form["dia_bp"] = st.number_input('Diastolic BP (mmHg)', min_value=30, max_value=150, value=draft["dia_bp"])
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                form["respiratory_rate"] = st.number_input('Respiratory Rate (breaths/min)', min_value=5, max_value=60, value=draft["respiratory_rate"])
+            with col2:
+                form["oxygen_saturation"] = st.number_input('Oxygen Saturation (%)', min_value=50, max_value=100, value=draft["oxygen_saturation"])
+            with col3:
+                form["pain_level"] = st.slider('Pain Level (0-10)', min_value=0, max_value=10, value=draft["pain_level"])
+        
+        with tab3:
+            st.info("Enter any available lab results (optional)")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                form["hb"] = st.number_input('Hemoglobin (g/dL)', min_value=0.0, max_value=25.0, value=draft["hb"], step=0.1)
+                form["wbc"] = st.number_input('WBC (×10^9/L)', min_value=0.0, max_value=50.0, value=draft["wbc"], step=0.1)
+                form["platelets"] = st.number_input('Platelets (×10^9/L)', min_value=0, max_value=1000, value=draft["platelets"])
+            with col2:
+                form["glucose"] = st.number_input('Glucose (mg/dL)', min_value=0, max_value=600, value=draft["glucose"])
+                form["creatinine"] = st.number_input('Creatinine (mg/dL)', min_value=0.0, max_value=15.0, value=draft["creatinine"], step=0.1)
+                form["bun"] = st.number_input('BUN (mg/dL)', min_value=0, max_value=200, value=draft["bun"])
+            with col3:
+                form["sodium"] = st.number_input('Sodium (mEq/L)', min_value=100, max_value=180, value=draft["sodium"])
+                form["potassium"] = st.number_input('Potassium (mEq/L)', min_value=2.0, max_value=8.0, value=draft["potassium"], step=0.1)
+                form["chloride"] = st.number_input('Chloride (mEq/L)', min_value=80, max_value=130, value=draft["chloride"])
+            
+            form["additional_labs"] = st.text_area('Additional Lab Results', value=draft["additional_labs"], placeholder='e.g., Liver function tests, Cardiac enzymes', height=100)
+        
+        with tab4:
+            form["lifestyle"] = st.text_area('Lifestyle Information', value=draft["lifestyle"], placeholder='e.g., smoker, alcohol consumption, exercise habits', height=100)
+            form["occupation"] = st.text_input('Occupation', value=draft["occupation"], placeholder='e.g., teacher, construction worker')
+            form["recent_travel"] = st.text_area('Recent Travel', value=draft["recent_travel"], placeholder='e.g., international travel in the last 3 months', height=100)
+            form["exposure_history"] = st.text_input('Exposure History', value=draft["exposure_history"], placeholder='e.g., sick contacts, environmental exposures')
+            form["additional_notes"] = st.text_area('Additional Clinical Notes', value=draft["additional_notes"], placeholder='Any other relevant information', height=100)
+        
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            run_clicked = st.form_submit_button("Run Medical Analysis", type="primary")
+        with col2:
+            draft_clicked = st.form_submit_button("Save Draft")
+        st.caption("Entries are only kept as a draft when you click Save Draft or Run Medical Analysis. "
+                   "Leaving this page before that discards unsaved changes.")
+    
+    # Either submit button saves the entered values as the session's draft
+    if run_clicked or draft_clicked:
+        st.session_state.consultation_draft = form
+    if draft_clicked:
+        st.success("Draft saved. It will be restored when you come back to this page.")
+
+    results_bus = get_results_bus()
+    
+    def run_consultation(job, patient, agents, llm):
+        # Runs on a job worker thread: no Streamlit calls in here.
+        # crewai is only imported once the first analysis is submitted
+        from services.consultation_crew import build_consultation_crew
+        from services.streaming import StreamBuffer, bind_streaming
+        
+        def record_task_output(task_name, output):
+            save_task_output(results_bus, job.id, task_name, output)
+            job.record_step(task_name)
+        
+        results_bus.discard(job.id)
+        medical_crew, tasks = build_consultation_crew(patient, agents, llm, record_task_output)
+        for task_name, task in tasks.items():
+            bind_streaming(task.agent, job.live.setdefault(task_name, StreamBuffer(task_name)),
+                           model=LLM_MODEL, cache=get_llm_cache())
+        medical_crew.kickoff()
+        
+        # Collect the results published by the task callbacks
+        outputs = results_bus.get(job.id)
+        parsed_results = {
+            task_name: outputs[task_name]
+            for task_name in ["diagnosis", "treatment", "research", "safety", "patient_education"]
+            if task_name in outputs
+        }
+        consultation_store.save(job.id, job.meta, parsed_results, started_at=job.started_at)
+        return {"results": parsed_results}
+    
+    job_manager = get_job_manager()
+    consultation_store = get_consultation_store()
+    
+    def submit_consultation(job_id, form):
+        job_manager.submit(
+            job_id,
+            run_consultation,
+            dict(form),
+            # Agents are built once per process; each run works on its own copies
+            get_consultation_agents(),
+            get_llm(),
+            meta={
+                "patient_name": form["patient_name"] if form["patient_name"] else "Anonymous Patient",
+                "age": form["age"],
+                "gender": form["gender"],
+                "main_symptoms": form["symptoms"],
+                # Kept with the stored results so the case can be run again
+                "form": dict(form)
+            }
+        )
+    
+    # Run analysis when the form is submitted
+    if run_clicked:
+        if not form["symptoms"]:
+            st.error("Please enter the patient's symptoms to continue.")
+        else:
+            # Identical inputs map to the same job id, so a double click or a
+            # rerun reattaches to the running crew instead of starting another.
+            # "Start New Consultation" moves the session to a new round, after
+            # which the same inputs are analysed afresh.
+            job_id = make_job_id(*form.values(), st.session_state.get("consultation_round", 0))
+            submit_consultation(job_id, form)
+            st.query_params["job"] = job_id
+    
+    # Reattach to the consultation run named in the URL, if any. Finished
+    # runs are rendered from the consultation store, so follow-up clicks,
+    # reloads and restarts never need the crew to run again.
+    job_id = st.query_params.get("job")
+    job = job_manager.get(job_id) if job_id else None
+    record = consultation_store.get(job_id) if job_id and (job is None or job.status == "done") else None
+    
+    if job is not None and job.active:
+        st.info(f"AI Medical Agents crew are analyzing the case for {job.meta['patient_name']} "
+                f"({int(job.elapsed())}s elapsed). You can leave this page open or come back later.")
+        render_task_status(job)
+        
+        # Show each section as soon as its task has finished
+        render_consultation_sections(results_bus.get(job.id))
+        render_live_output(job)
+        time.sleep(1)
+        st.rerun()
+    elif job is not None and job.status == "failed":
+        st.error(f"Medical analysis failed: {job.error}")
+    elif record is not None:
+        parsed_results = record["results"]
+        meta = record["meta"]
+        consultation_time = datetime.fromtimestamp(record["finished_at"])
+        
+        # Store consultation in session state (once per run)
+        if job_id not in st.session_state.recorded_jobs:
+            st.session_state.recorded_jobs.add(job_id)
+            new_consultation = {
+                "id": len(st.session_state.past_consultations) + 1,
+                "timestamp": consultation_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "patient_name": meta["patient_name"],
+                "age": meta["age"],
+                "gender": meta["gender"],
+                "main_symptoms": meta["main_symptoms"],
+                "results": parsed_results
+            }
+            st.session_state.past_consultations.append(new_consultation)
+        
+        # Display results
+        st.success(f"Medical analysis complete! ({int(record['finished_at'] - record['started_at'])}s)")
+        if job is not None:
+            with st.expander("Agent timings"):
+                render_task_status(job)
+        
+        render_consultation_sections(parsed_results)
+        
+        # Follow-up actions only rerun this page; only "Run Analysis Again" starts another crew
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            # Generate prescription if treatment plan exists
+            show_prescription = False
+            if "treatment" in parsed_results and parsed_results["treatment"]:
+                show_prescription = st.toggle("View Prescription", key=f"show_prescription_{job_id}")
+        with col2:
+            report = "# Medical Consultation Report\n\n"
+            report += f"## Patient Information\n- Name: {meta['patient_name']}\n"
+            report += f"- Age: {meta['age']} years\n- Gender: {meta['gender']}\n"
+            report += f"- Date: {consultation_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            
+            for section in CONSULTATION_SECTIONS:
+                key, title, _, _ = section
+                if key in parsed_results and parsed_results[key]:
+                    report += f"## {title}\n{parsed_results[key]}\n\n"
+            
+            st.download_button(
+                "Download Full Report",
+                data=report,
+                file_name=f"medical_report_{consultation_time.strftime('%Y%m%d_%H%M%S')}.txt",
+                mime="text/plain"
+            )
+        with col3:
+            if st.button("Start New Consultation"):
+                st.session_state.pop(f"show_prescription_{job_id}", None)
+                st.session_state.consultation_draft = dict(CONSULTATION_FORM_DEFAULTS)
+                st.session_state.consultation_round = st.session_state.get("consultation_round", 0) + 1
+                del st.query_params["job"]
+                st.rerun()
+        with col4:
+            # An explicit re-analysis of the same case gets a fresh run id,
+            # so it bypasses both the finished job and the stored results
+            if "form" in meta and st.button("Run Analysis Again"):
+                st.session_state.pop(f"show_prescription_{job_id}", None)
+                new_job_id = make_job_id(*meta["form"].values(), time.time())
+                submit_consultation(new_job_id, meta["form"])
+                st.query_params["job"] = new_job_id
+                st.rerun()
+        
+        if show_prescription:
+            extracted_medications = extract_medications(parsed_results["treatment"])
+            main_diagnosis = ""
+            if "diagnosis" in parsed_results and parsed_results["diagnosis"]:
+                main_diagnosis = parsed_results["diagnosis"].split("\n")[0] if "\n" in parsed_results["diagnosis"] else parsed_results["diagnosis"]
+            
+            prescription_html = generate_prescription(
+                meta["patient_name"],
+                meta["gender"],
+                meta["age"],
+                main_diagnosis[:100],
+                extracted_medications
+            )
+            st.markdown(prescription_html, unsafe_allow_html=True)
+    elif job_id:
+        st.warning("This consultation is no longer available on the server. Please run the analysis again.")
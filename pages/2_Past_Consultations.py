@@ -0,0 +1,94 @@
+import services.sqlite_compat  # Must run before anything imports sqlite3
+
+import streamlit as st
+import pandas as pd
+from ui.layout import setup_page, profile_page
+
+setup_page()
+
+with profile_page("Past Consultations"):
+    st.markdown("<h1 class='main-header'>Past Consultations</h1>", unsafe_allow_html=True)
+    
+    if not st.session_state.past_consultations:
+        st.info("No past consultations found. Start a new consultation to see results here.")
+    else:
+        # Create a dataframe for easier display
+        consultations_df = pd.DataFrame([
+            {
+                "ID": c["id"],
+                "Date": c["timestamp"],
+                "Patient": c["patient_name"],
+                "Age": c["age"],
+                "Gender": c["gender"],
+                "Symptoms": c["main_symptoms"][:50] + "..." if len(c["main_symptoms"]) > 50 else c["main_symptoms"]
+            } for c in st.session_state.past_consultations
+        ])
+        
+        # Display as a table
+        st.dataframe(consultations_df, use_container_width=True)
+        
+        # Allow selection of consultation to view details
+        selected_id = st.selectbox("Select consultation to view details", 
+                                 options=consultations_df["ID"].tolist(),
+                                 format_func=lambda x: f"Consultation #{x} - {consultations_df[consultations_df['ID']==x]['Patient'].values[0]} ({consultations_df[consultations_df['ID']==x]['Date'].values[0]})")
+        
+        if selected_id:
+            # Find the selected consultation
+            selected_consultation = next((c for c in st.session_state.past_consultations if c["id"] == selected_id), None)
+            
+            if selected_consultation:
+                # Display consultation details
+                st.subheader(f"Consultation for {selected_consultation['patient_name']}")
+                st.markdown(f"**Date:** {selected_consultation['timestamp']}")
+                st.markdown(f"**Patient:** {selected_consultation['patient_name']}, {selected_consultation['age']} years, {selected_consultation['gender']}")
+                
+                # Display the content in tabs with proper card styling
+                tab1, tab2, tab3, tab4, tab5 = st.tabs(["Diagnosis", "Treatment", "Research", "Alerts", "Patient Education"])
+                
+                with tab1:
+                    st.markdown("""
+                    <div class="card">
+                        <h3>🔍 Differential Diagnosis</h3>
+                        <div class="markdown-text-container">
+                    """, unsafe_allow_html=True)
+                    st.markdown(selected_consultation["results"].get("diagnosis", "No diagnosis available"))
+                    st.markdown("</div></div>", unsafe_allow_html=True)
+                
+                with tab2:
+                    st.markdown("""
+                    <div class="card">
+                        <h3>💊 Treatment Plan</h3>
+                        <div class="markdown-text-container">
+                    """, unsafe_allow_html=True)
+                    st.markdown(selected_consultation["results"].get("treatment", "No treatment plan available"))
+                    st.markdown("</div></div>", unsafe_allow_html=True)
+                
+                with tab3:
+                    st.markdown("""
+                    <div class="card">
+                        <h3>📚 Medical Research</h3>
+                        <div class="markdown-text-container">
+                    """, unsafe_allow_html=True)
+                    st.markdown(selected_consultation["results"].get("research", "No research available"))
+                    st.markdown("</div></div>", unsafe_allow_html=True)
+                
+                with tab4:
+                    st.markdown("""
+                    <div class="card">
+                        <h3>⚠️ Important Alerts</h3>
+                        <div class="markdown-text-container">
+                    """, unsafe_allow_html=True)
+                    # Check both possible locations for alerts
+                    alerts_content = selected_consultation["results"].get("alerts", 
+                                      selected_consultation["results"].get("safety", "No critical alerts for this consultation."))
+                    st.markdown(alerts_content)
+                    st.markdown("</div></div>", unsafe_allow_html=True)
+                
+                with tab5:
+                    st.markdown("""
+                    <div class="card">
+                        <h3>📋 Patient Education</h3>
+                        <div class="markdown-text-container">
+                    """, unsafe_allow_html=True)
+                    st.markdown(selected_consultation["results"].get("patient_education", "No patient education materials available"))
+                    st.markdown("</div></div>", unsafe_allow_html=True)
@@ -0,0 +1,376 @@
+import services.sqlite_compat  # Must run before anything imports sqlite3
+
+import streamlit as st
+import time
+import plotly.graph_objects as go
+from services.knowledge_cache import normalize_term
+from services.registry import (
+    LLM_MODEL, get_agent_tools, get_knowledge_agents, get_knowledge_cache, get_knowledge_flights, get_llm_cache
+)
+from ui.knowledge import KNOWLEDGE_SECTION_HEADERS, parse_knowledge_sections
+from ui.layout import setup_page, profile_page
+
+setup_page()
+
+with profile_page("Medical Knowledge"):
+    st.markdown("<h1 class='main-header'>Medical Knowledge Database</h1>", unsafe_allow_html=True)
+    st.markdown("""
+    <div class="info-box">
+        This knowledge base is powered by specialized AI agents that can search, analyze, and summarize medical information from trusted sources.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Regenerate only the expired sections of a cached entry with one synthesizer call.
+    # Runs on the flight leader's worker: crewai is only imported once a refresh runs
+    def refresh_knowledge_sections(term, stale_sections, current_sections):
+        from services.knowledge_crew import build_refresh_crew
+        from services.streaming import StreamBuffer, bind_streaming
+        
+        search_tool, _ = get_agent_tools()
+        refresh_crew, refresh_task = build_refresh_crew(
+            term, stale_sections, current_sections, get_knowledge_agents(), search_tool
+        )
+        bind_streaming(refresh_task.agent, StreamBuffer(refresh_task.agent.role),
+                       model=LLM_MODEL, cache=get_llm_cache())
+        parsed = parse_knowledge_sections(refresh_crew.kickoff())
+        return {key: parsed[key] for key in stale_sections if parsed[key]}
+
+    # Search interface
+    st.subheader("Search Medical Knowledge")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        search_term = st.text_input("Enter medical term or condition", placeholder="e.g., hypertension, diabetes, asthma")
+    with col2:
+        st.write("")
+        st.write("")
+        search_button = st.button("Search")
+    
+    force_refresh = st.checkbox("Bypass knowledge cache", value=False,
+                                help="Run the knowledge agents even if this term was searched recently")
+    
+    if search_button and search_term:
+        # Equivalent searches ("High blood pressure", "hypertension") share one entry
+        knowledge_cache = get_knowledge_cache()
+        knowledge_flights = get_knowledge_flights()
+        term_key = normalize_term(search_term)
+        cached = None if force_refresh else knowledge_cache.get(term_key)
+        if cached and len(cached["stale"]) == len(cached["sections"]):
+            # Nothing worth keeping, run the full crew
+            cached = None
+        
+        if cached:
+            knowledge_sections = cached["sections"]
+            if cached["stale"]:
+                stale_titles = ", ".join(KNOWLEDGE_SECTION_HEADERS[key].title() for key in cached["stale"])
+                
+                def run_knowledge_refresh():
+                    refreshed = refresh_knowledge_sections(search_term, cached["stale"], knowledge_sections)
+                    # Stamp every attempted section, keeping the old content where the
+                    # refresh returned nothing, so it is not retried on every hit
+                    knowledge_cache.update_sections(term_key, {
+                        key: refreshed.get(key, knowledge_sections.get(key, "")) for key in cached["stale"]
+                    })
+                    return refreshed
+                
+                flight = knowledge_flights.submit(f"refresh:{term_key}", run_knowledge_refresh)
+                try:
+                    with st.spinner(f"Refreshing outdated sections: {stale_titles}..."):
+                        refreshed = flight.future.result()
+                except Exception as e:
+                    # Keep showing what the cache has; the failed flight is dropped,
+                    # so the next search for this term tries the refresh again
+                    refreshed = {}
+                    st.warning(f"Could not refresh {stale_titles} ({e}); showing the cached version.")
+                else:
+                    knowledge_sections.update(refreshed)
+                    refreshed_titles = ", ".join(KNOWLEDGE_SECTION_HEADERS[key].title() for key in refreshed)
+                    not_refreshed = ", ".join(
+                        KNOWLEDGE_SECTION_HEADERS[key].title() for key in cached["stale"] if key not in refreshed
+                    )
+                    message = f"⚡ Served from the knowledge cache as '{term_key}'"
+                    if refreshed_titles:
+                        message += f"; refreshed {refreshed_titles}"
+                    if not_refreshed:
+                        message += f"; could not refresh {not_refreshed}, showing the cached version"
+                    st.success(message)
+            else:
+                cached_minutes = int((time.time() - min(cached["updated_at"].values())) / 60)
+                st.success(f"⚡ Served instantly from the knowledge cache: '{cached['term']}' "
+                           f"(searched {cached_minutes} min ago, matched as '{term_key}')")
+        else:
+            with st.spinner(f"Searching for information about '{search_term}'..."):
+                def run_knowledge_search(streams):
+                    # Runs on the flight leader's worker: the crew is only built,
+                    # and crewai only imported, by the search that actually runs it
+                    from services.knowledge_crew import build_knowledge_crew
+                    from services.streaming import StreamBuffer, bind_streaming
+                    
+                    # Agents are built once per process; each run works on its own copies
+                    knowledge_crew, tasks = build_knowledge_crew(search_term, get_knowledge_agents())
+                    # Stream tokens from whichever agent is active into a live placeholder
+                    for task_name, task in tasks.items():
+                        streams[task_name] = StreamBuffer(task.agent.role)
+                        bind_streaming(task.agent, streams[task_name], model=LLM_MODEL, cache=get_llm_cache())
+                    # Parse the results into sections
+                    sections = parse_knowledge_sections(knowledge_crew.kickoff())
+                    knowledge_cache.put(term_key, search_term, sections)
+                    return sections
+
+                # Concurrent searches for the same term share one crew run
+                knowledge_streams = {}
+                flight = knowledge_flights.submit(f"search:{term_key}", run_knowledge_search, knowledge_streams,
+                                                  context=knowledge_streams)
+                if not flight.leader:
+                    st.info("Another user is already searching for this term; sharing their results.")
+
+                live_placeholder = st.empty()
+                while not flight.future.done():
+                    # The leader fills the buffers in once its crew is built
+                    active = max(list(flight.context.values()), key=lambda b: b.updated_at or 0, default=None)
+                    if active is not None and active.updated_at:
+                        live_placeholder.info(f"**{active.label}** is writing…\n\n{active.tail(1500)}")
+                    time.sleep(0.25)
+                knowledge_sections = flight.future.result()
+                live_placeholder.empty()
+            
+            # Display results
+            st.success("Medical knowledge search complete!")
+
+        # Custom CSS for knowledge cards
+        st.markdown("""
+        <style>
+        .knowledge-card {
+            background-color: white;
+            border-radius: 10px;
+            padding: 20px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            margin-bottom: 20px;
+            border-left: 5px solid #3498db;
+            transition: transform 0.3s ease;
+        }
+        .knowledge-card:hover {
+            transform: translateY(-3px);
+            box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
+        }
+        .knowledge-card h3 {
+            color: #2c3e50;
+            margin-top: 0;
+            padding-bottom: 10px;
+            border-bottom: 1px solid #eee;
+        }
+        .knowledge-content {
+            line-height: 1.6;
+            font-size: 15px;
+        }
+        .knowledge-content p {
+            margin-bottom: 12px;
+        }
+        .knowledge-content ul {
+            padding-left: 25px;
+            margin-bottom: 15px;
+        }
+        .knowledge-content li {
+            margin-bottom: 8px;
+            list-style-type: disc;
+        }
+        .knowledge-content strong {
+            color: #2c3e50;
+            font-weight: 600;
+        }
+        .definition-card {
+            border-left-color: #3498db;
+        }
+        .clinical-card {
+            border-left-color: #2ecc71;
+        }
+        .diagnostic-card {
+            border-left-color: #f39c12;
+        }
+        .treatment-card {
+            border-left-color: #9b59b6;
+        }
+        .advances-card {
+            border-left-color: #e74c3c;
+        }
+        .references-card {
+            border-left-color: #1abc9c;
+        }
+        .knowledge-header {
+            display: flex;
+            align-items: center;
+            margin-bottom: 15px;
+        }
+        .knowledge-icon {
+            font-size: 24px;
+            margin-right: 10px;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+
+
+        # Display in expandable sections with enhanced styling
+        with st.expander("📖 Definition and Overview", expanded=True):
+            if knowledge_sections["definition"]:
+                st.markdown(f"""
+                <div class="knowledge-card definition-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">📖</span>
+                        <h3>Definition and Overview</h3>
+                    </div>
+                    <div class="knowledge-content">
+                        {knowledge_sections["definition"]}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="knowledge-card definition-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">📖</span>
+                        <h3>Definition and Overview</h3>
+                    </div>
+                    <p>No definition information available for this term.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with st.expander("🩺 Clinical Presentation"):
+            if knowledge_sections["clinical_presentation"]:
+                st.markdown(f"""
+                <div class="knowledge-card clinical-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">🩺</span>
+                        <h3>Clinical Presentation</h3>
+                    </div>
+                    <div class="knowledge-content">
+                        {knowledge_sections["clinical_presentation"]}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="knowledge-card clinical-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">🩺</span>
+                        <h3>Clinical Presentation</h3>
+                    </div>
+                    <p>No clinical presentation information available.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with st.expander("🔍 Diagnostic Approach"):
+            if knowledge_sections["diagnostic_approach"]:
+                st.markdown(f"""
+                <div class="knowledge-card diagnostic-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">🔍</span>
+                        <h3>Diagnostic Approach</h3>
+                    </div>
+                    <div class="knowledge-content">
+                        {knowledge_sections["diagnostic_approach"]}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="knowledge-card diagnostic-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">🔍</span>
+                        <h3>Diagnostic Approach</h3>
+                    </div>
+                    <p>No diagnostic approach information available.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with st.expander("💊 Treatment Options"):
+            if knowledge_sections["treatment_options"]:
+                st.markdown(f"""
+                <div class="knowledge-card treatment-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">💊</span>
+                        <h3>Treatment Options</h3>
+                    </div>
+                    <div class="knowledge-content">
+                        {knowledge_sections["treatment_options"]}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="knowledge-card treatment-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">💊</span>
+                        <h3>Treatment Options</h3>
+                    </div>
+                    <p>No treatment options information available.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with st.expander("🚀 Recent Advances"):
+            if knowledge_sections["recent_advances"]:
+                st.markdown(f"""
+                <div class="knowledge-card advances-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">🚀</span>
+                        <h3>Recent Advances</h3>
+                    </div>
+                    <div class="knowledge-content">
+                        {knowledge_sections["recent_advances"]}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="knowledge-card advances-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">🚀</span>
+                        <h3>Recent Advances</h3>
+                    </div>
+                    <p>No recent advances information available.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with st.expander("📚 References"):
+            if knowledge_sections["references"]:
+                st.markdown(f"""
+                <div class="knowledge-card references-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">📚</span>
+                        <h3>References</h3>
+                    </div>
+                    <div class="knowledge-content">
+                        {knowledge_sections["references"]}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="knowledge-card references-card">
+                    <div class="knowledge-header">
+                        <span class="knowledge-icon">📚</span>
+                        <h3>References</h3>
+                    </div>
+                    <p>No references available.</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+        # Visualization of search results (mock data)
+        st.subheader("Knowledge Graph")
+        categories = ["Definition", "Diagnosis", "Treatment", "Research"]
+        confidence = [90, 85, 80, 75]  # Mock confidence scores
+
+        fig = go.Figure(go.Bar(
+            x=categories,
+            y=confidence,
+            marker_color=['#3498db', '#2ecc71', '#f39c12', '#9b59b6']
+        ))
+        fig.update_layout(
+            title="Information Confidence Levels",
+            yaxis_title="Confidence Score (%)",
+            height=400
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    else:
+        # Show knowledge base statistics when no search is active
+        pass
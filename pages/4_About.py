@@ -0,0 +1,80 @@
+import services.sqlite_compat  # Must run before anything imports sqlite3
+
+import streamlit as st
+
+from ui.layout import setup_page, profile_page
+
+setup_page()
+
+with profile_page("About"):
+    st.markdown("<h1 class='main-header'>About MediAssist AI</h1>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### Multi-Agent AI Medical Assistant Platform
+        
+        MediAssist AI is an advanced platform that leverages multiple specialized AI agents to provide comprehensive medical decision support. By combining the expertise of various specialized agents, the system delivers more thorough and accurate medical assessments than a single AI model could provide.
+        
+        #### Core Technology
+        The platform is built on a collaborative multi-agent framework, where each agent has specialized medical knowledge and responsibilities:
+        
+        - **Primary Diagnostician**: Coordinates the initial diagnostic process
+        - **Specialist Diagnostician**: Provides specialized medical expertise
+        - **Treatment Advisor**: Develops personalized treatment strategies
+        - **Pharmacology Specialist**: Ensures medication safety and efficacy
+        - **Medical Researcher**: Integrates current medical literature
+        - **Patient Educator**: Creates accessible educational materials
+        - **Safety Officer**: Identifies potential risks and precautions
+        - **medical_research_agent**: summarize the most relevant medical information from trusted sources
+        - **evidence_evaluator**: Evaluate the quality and relevance of medical evidence
+        - **knowledge_synthesizer**: Create clear, organized summaries of medical information
+        
+        #### How It Works
+        The agents collaborate through a structured workflow, sharing information and building upon each other's expertise to develop a comprehensive medical assessment and plan.
+        
+        
+        """)
+        
+
+        st.markdown("""
+        <div class="card" style="border-left: 5px solid #e74c3c; background-color: #fde9e8;">
+            <h3 style="color: #e74c3c;">⚠️ Important Disclaimer</h3>
+            <div class="markdown-text-container">
+                <strong>This application is for educational and demonstration purposes only.</strong> It is not a substitute for professional medical advice, diagnosis, or treatment. Always seek the advice of qualified healthcare providers with any questions you may have regarding medical conditions.
+                <br><br>
+                <strong>Important Note:</strong> This is a demonstration of AI capabilities in healthcare. The system is not FDA-approved for clinical use and should not be used for actual medical decision-making.
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with col2:
+        # Display a mock architecture diagram
+        
+        
+        st.markdown("#### Version Information")
+        st.markdown("- **AI Framework:** CrewAI")
+        st.markdown("- **Last Updated:** March 2025")
+        
+        st.markdown("#### Development")
+        st.markdown("Developed as a demonstration of multi-agent AI systems in healthcare applications.")
+    
+    # Contact form
+    st.subheader("Contact")
+    
+    with st.form("contact_form"):
+        st.markdown("Have questions or feedback about MediAssist AI?")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            name = st.text_input("Name")
+        with col2:
+            email = st.text_input("Email")
+        
+        message = st.text_area("Message")
+        
+        submitted = st.form_submit_button("Send Message")
+        if submitted:
+            st.success("Thank you for your message! This is a demo form and does not actually send messages.")
@@ -0,0 +1,45 @@
+from crewai import LLM
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+from services.llm_cache import LLMResponseCache
+
+
+class CachedLLM(LLM):
+    """crewai LLM that answers repeated prompts from an LLMResponseCache.
+
+    Calls that pass ``available_functions`` execute tools as a side effect and
+    are never cached. Cached answers are re-emitted as a single stream chunk so
+    live output still shows them.
+    """
+
+    def __init__(self, *args, cache=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def _cache_key(self, messages, tools):
+        params = {
+            "temperature": getattr(self, "temperature", None),
+            "top_p": getattr(self, "top_p", None),
+            "max_tokens": getattr(self, "max_tokens", None),
+            "stop": getattr(self, "stop", None),
+            "response_format": getattr(self, "response_format", None)
+        }
+        return LLMResponseCache.make_key(self.model, params, messages, tools)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        if self.cache is None or available_functions:
+            return super().call(messages, tools=tools, callbacks=callbacks,
+                                available_functions=available_functions, **kwargs)
+
+        key = self._cache_key(messages, tools)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if self.stream:
+                crewai_event_bus.emit(self, event=LLMStreamChunkEvent(chunk=cached))
+            return cached
+
+        response = super().call(messages, tools=tools, callbacks=callbacks, **kwargs)
+        if isinstance(response, str) and response:
+            self.cache.put(key, self.model, response)
+        return response
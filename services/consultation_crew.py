@@ -0,0 +1,201 @@
+"""Consultation crew factory.
+
+The seven consultation tasks embed the whole patient form in their
+descriptions. They are only needed once an analysis is submitted, so they
+are built here, on the job worker, from the submitted form values instead
+of on every rerun of the New Consultation page.
+"""
+from crewai import Crew, Process, Task
+
+from services.registry import agents_for_run
+
+DIAGNOSIS_DESCRIPTION = (
+    "1. Analyze the patient profile: {patient_name}, {gender}, {age} years old, {weight_kg}kg.\n"
+    "2. Review symptoms: {symptoms}\n"
+    "3. Symptom duration: {symptom_duration}\n"
+    "4. Consider medical history: {medical_history}\n"
+    "5. Family history: {family_history}\n"
+    "6. Note current medications: {medications}\n"
+    "7. Be aware of allergies: {allergies}\n"
+    "8. Consider vital signs: Temp {temperature}°C, HR {heart_rate}, BP {sys_bp}/{dia_bp}, RR {respiratory_rate}, O2 Sat {oxygen_saturation}%, Pain level {pain_level}/10\n"
+    "9. Review lab results if available: Hb {hb}, WBC {wbc}, Platelets {platelets}, Glucose {glucose}, Creatinine {creatinine}, BUN {bun}, Sodium {sodium}, Potassium {potassium}, Chloride {chloride}, Additional labs: {additional_labs}\n"
+    "10. Consider lifestyle factors: {lifestyle}\n"
+    "11. Note occupation: {occupation}\n"
+    "12. Recent travel: {recent_travel}\n"
+    "13. Exposure history: {exposure_history}\n"
+    "14. Additional notes: {additional_notes}\n"
+    "15. Based on all the information above, coordinate with the specialist diagnostician as needed to develop a comprehensive differential diagnosis.\n"
+    "16. Prioritize diagnoses based on likelihood and severity.\n"
+    "17. Provide a detailed explanation of your diagnostic reasoning.\n"
+    "18. Format your diagnosis with a clear ## DIAGNOSIS section header."
+)
+
+SPECIALIST_DESCRIPTION = (
+    "1. Review the primary diagnostician's differential diagnosis.\n"
+    "2. Provide specialized expertise for any complex conditions identified.\n"
+    "3. Evaluate the diagnoses from your specialist perspective.\n"
+    "4. Refine or expand the diagnosis based on your specialized knowledge.\n"
+    "5. Identify any rare or complex conditions that might have been overlooked.\n"
+    "6. Provide probability estimates for each diagnosis in the differential.\n"
+    "7. Format your contribution to integrate with the primary diagnosis."
+)
+
+TREATMENT_DESCRIPTION = (
+    "1. Based on the confirmed diagnoses, develop a comprehensive treatment plan for {patient_name}, {gender}, {age} years old, {weight_kg}kg.\n"
+    "2. Consider the patient's current medications: {medications}\n"
+    "3. Consider allergies: {allergies}\n"
+    "4. Consider medical history: {medical_history}\n"
+    "5. Consider vital signs and lab values when determining appropriate treatments.\n"
+    "6. Consult with the pharmacology specialist about medication choices and potential interactions.\n"
+    "7. Include both pharmacological and non-pharmacological interventions.\n"
+    "8. Provide specific medication dosages, frequencies, and durations when applicable.\n"
+    "9. Include follow-up recommendations and monitoring parameters.\n"
+    "10. Format your plan with a clear ## TREATMENT PLAN section header."
+)
+
+MEDICATION_SAFETY_DESCRIPTION = (
+    "1. Review the proposed medications in the treatment plan.\n"
+    "2. Check for potential drug interactions with current medications: {medications}\n"
+    "3. Verify appropriate dosages based on patient profile: {age} years, {weight_kg}kg, creatinine {creatinine}.\n"
+    "4. Check for contraindications based on allergies: {allergies}\n"
+    "5. Check for contraindications based on medical history: {medical_history}\n"
+    "6. Recommend dosage adjustments if necessary.\n"
+    "7. Suggest alternative medications if safety issues are identified.\n"
+    "8. Provide key counseling points for each medication.\n"
+    "9. Include your analysis in the safety assessment."
+)
+
+RESEARCH_DESCRIPTION = (
+    "1. Search for relevant, recent medical literature related to the diagnoses and treatments.\n"
+    "2. Identify evidence-based guidelines that support the diagnostic and treatment recommendations.\n"
+    "3. Find any recent research that might influence the care plan.\n"
+    "4. Evaluate the quality and relevance of the evidence.\n"
+    "5. Synthesize the research findings into actionable insights.\n"
+    "6. Include 3-5 specific, relevant citations.\n"
+    "7. Format your findings with a clear ## MEDICAL RESEARCH section header."
+)
+
+PATIENT_EDUCATION_DESCRIPTION = (
+    "1. Based on the diagnosis and treatment plan, develop educational materials for {patient_name}.\n"
+    "2. Consider the patient's profile: {gender}, {age} years old.\n"
+    "3. Explain the condition(s) in clear, accessible language.\n"
+    "4. Provide information about the prescribed treatments and why they're important.\n"
+    "5. Include lifestyle modifications and self-care strategies.\n"
+    "6. Explain warning signs that should prompt medical attention.\n"
+    "7. Address common questions patients might have about their condition.\n"
+    "8. Create monitoring guidance if applicable.\n"
+    "9. Format your materials with a clear ## PATIENT EDUCATION section header."
+)
+
+SAFETY_DESCRIPTION = (
+    "1. Review the entire case, including diagnosis, treatment plan, and medication recommendations.\n"
+    "2. Identify any critical safety concerns that require immediate attention.\n"
+    "3. Highlight key warning signs that should prompt emergency care.\n"
+    "4. Note any diagnosis or treatment risks that clinicians should be aware of.\n"
+    "5. Recommend appropriate safety monitoring parameters.\n"
+    "6. Suggest precautions to minimize risks.\n"
+    "7. Format your assessment with a clear ## ALERTS section header."
+)
+
+
+def build_consultation_crew(patient, agents, llm, on_task_output):
+    """Build a fresh consultation crew for one submitted patient form.
+
+    ``patient`` holds the form values, ``agents`` the cached agent prototypes
+    from ``get_consultation_agents`` (the crew runs on copies of them), and
+    ``on_task_output(task_name, output)`` is called as each task finishes.
+    Returns ``(crew, tasks)`` with ``tasks`` keyed by task name in execution order.
+    """
+    def save_output(task_name):
+        def callback(output):
+            on_task_output(task_name, output)
+            return output
+        return callback
+
+    diagnose_task = Task(
+        description=DIAGNOSIS_DESCRIPTION.format(**patient),
+        agent=agents["primary_diagnostician"],
+        expected_output="A comprehensive differential diagnosis with detailed explanation of diagnostic reasoning.",
+        callback=save_output("diagnosis")
+    )
+
+    specialist_consult_task = Task(
+        description=SPECIALIST_DESCRIPTION,
+        agent=agents["specialist_diagnostician"],
+        expected_output="Specialized diagnostic assessment that refines or validates the primary diagnosis.",
+        context=[diagnose_task],
+        callback=save_output("specialist")
+    )
+
+    treatment_plan_task = Task(
+        description=TREATMENT_DESCRIPTION.format(**patient),
+        agent=agents["treatment_advisor"],
+        expected_output="A comprehensive, individualized treatment plan that addresses all diagnosed conditions.",
+        context=[diagnose_task, specialist_consult_task],
+        callback=save_output("treatment")
+    )
+
+    medication_safety_task = Task(
+        description=MEDICATION_SAFETY_DESCRIPTION.format(**patient),
+        agent=agents["pharmacology_specialist"],
+        expected_output="A medication safety analysis that identifies potential issues and provides recommendations.",
+        context=[diagnose_task, specialist_consult_task, treatment_plan_task],
+        async_execution=True,
+        callback=save_output("med_safety")
+    )
+
+    research_task = Task(
+        description=RESEARCH_DESCRIPTION,
+        agent=agents["medical_researcher"],
+        expected_output="A synthesis of relevant medical literature that supports the diagnosis and treatment recommendations.",
+        context=[diagnose_task, specialist_consult_task, treatment_plan_task],
+        async_execution=True,
+        callback=save_output("research")
+    )
+
+    patient_education_task = Task(
+        description=PATIENT_EDUCATION_DESCRIPTION.format(**patient),
+        agent=agents["patient_educator"],
+        expected_output="Clear, accessible patient education materials tailored to the diagnosis and treatment plan.",
+        context=[diagnose_task, specialist_consult_task, treatment_plan_task],
+        async_execution=True,
+        callback=save_output("patient_education")
+    )
+
+    safety_assessment_task = Task(
+        description=SAFETY_DESCRIPTION,
+        agent=agents["safety_officer"],
+        expected_output="A safety assessment that identifies potential risks and provides safety recommendations.",
+        context=[
+            diagnose_task,
+            specialist_consult_task,
+            treatment_plan_task,
+            medication_safety_task,
+            research_task,
+            patient_education_task
+        ],
+        callback=save_output("safety")
+    )
+
+    # The tasks form a DAG: diagnosis -> specialist review -> treatment plan,
+    # then medication safety, research and patient education run concurrently
+    # (async_execution) off those outputs, and the safety assessment waits for
+    # all three branches before it runs. Latency is the critical path rather
+    # than the sum of all seven tasks.
+    tasks = {
+        "diagnosis": diagnose_task,
+        "specialist": specialist_consult_task,
+        "treatment": treatment_plan_task,
+        "med_safety": medication_safety_task,
+        "research": research_task,
+        "patient_education": patient_education_task,
+        "safety": safety_assessment_task
+    }
+    crew = Crew(
+        agents=agents_for_run(list(tasks.values())),
+        tasks=list(tasks.values()),
+        verbose=True,
+        process=Process.sequential,  # Sequential driver; async tasks fan out until the next sync task
+        manager_llm=llm
+    )
+    return crew, tasks
@@ -0,0 +1,67 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class ConsultationStore:
+    """Finished consultation results in SQLite, keyed by run (job) id.
+
+    A run's results are written once when its crew finishes. Every later
+    rerun, reload or follow-up action renders them from here, so they
+    outlive the in-memory job and never need the crew to run again.
+    Results hold patient data, so they are kept for ``ttl_seconds`` only:
+    expired runs are never returned and are deleted at startup and on every save.
+    """
+
+    def __init__(self, path, ttl_seconds=30 * 24 * 3600):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS consultations ("
+            "run_id TEXT PRIMARY KEY, meta TEXT, results TEXT, "
+            "started_at REAL, finished_at REAL)"
+        )
+        self._purge()
+        self._conn.commit()
+
+    def save(self, run_id, meta, results, started_at, finished_at=None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO consultations (run_id, meta, results, started_at, finished_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_id, json.dumps(meta), json.dumps(results), started_at, finished_at or time.time())
+            )
+            self._purge()
+            self._conn.commit()
+
+    def get(self, run_id):
+        """Return ``{"run_id", "meta", "results", "started_at", "finished_at"}`` or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta, results, started_at, finished_at FROM consultations "
+                "WHERE run_id = ? AND finished_at >= ?", (run_id, time.time() - self.ttl_seconds)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "run_id": run_id,
+            "meta": json.loads(row[0]),
+            "results": json.loads(row[1]),
+            "started_at": row[2],
+            "finished_at": row[3]
+        }
+
+    def purge(self):
+        """Delete runs older than the retention period."""
+        with self._lock:
+            self._purge()
+            self._conn.commit()
+
+    def _purge(self):
+        self._conn.execute("DELETE FROM consultations WHERE finished_at < ?", (time.time() - self.ttl_seconds,))
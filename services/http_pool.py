@@ -0,0 +1,102 @@
+import http.cookiejar
+import importlib.util
+import os
+import threading
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connection pool limits and timeouts shared by every outbound client
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_HOSTS", "10"))
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "60"))
+KEEPALIVE_SECONDS = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "60"))
+
+
+
+class _NoCookies(http.cookiejar.CookiePolicy):
+    """Cookie policy that neither stores nor sends cookies."""
+    netscape = True
+    rfc2965 = False
+    hide_cookie2 = False
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+    def domain_return_ok(self, domain, request):
+        return False
+
+    def path_return_ok(self, path, request):
+        return False
+
+
+_lock = threading.Lock()
+_session = None
+_httpx_client = None
+
+
+def http_session():
+    """The process-wide keep-alive ``requests`` session.
+
+    It is shared by every user and thread, so its cookie jar is disabled:
+    cookies set by one request (e.g. a site scraped for one user) are never
+    sent with another. Cookies passed explicitly to a call still apply to
+    that call.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            session.cookies.set_policy(_NoCookies())
+            # No adapter-level retries: callers decide what is safe to retry
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def httpx_client():
+    """The process-wide ``httpx`` client, speaking HTTP/2 when ``h2`` is installed."""
+    global _httpx_client
+    with _lock:
+        if _httpx_client is None:
+            _httpx_client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=POOL_MAXSIZE,
+                    max_keepalive_connections=POOL_MAXSIZE,
+                    keepalive_expiry=KEEPALIVE_SECONDS
+                ),
+                timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT)
+            )
+        return _httpx_client
+
+
+def _pooled_request(method, url, **kwargs):
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+    return http_session().request(method=method, url=url, **kwargs)
+
+
+def install_http_pool():
+    """Route module-level ``requests`` calls and LiteLLM through the shared pools.
+
+    SerperDevTool, ScrapeWebsiteTool and other tools call ``requests.get`` /
+    ``requests.request`` directly, each opening a fresh connection (and TLS
+    handshake). Patching those entry points sends them through one pooled
+    keep-alive session instead. LiteLLM, which backs every crewai LLM, is
+    given the shared httpx client. Safe to call more than once.
+    """
+    if requests.api.request is _pooled_request:
+        return
+    requests.api.request = _pooled_request
+    requests.request = _pooled_request
+
+    import litellm
+    litellm.client_session = httpx_client()
+
@@ -0,0 +1,132 @@
+"""Check each page's cold-start import cost against a recorded budget.
+
+Every page script listed in import_budget.json is run on its own under
+``python -X importtime`` through Streamlit's AppTest harness, which gives the
+page a real session state (bare mode has none on Streamlit 1.30). Only the
+imports made after Streamlit itself has loaded are counted, so the budget is
+what the page adds to a warm server process. A page fails when that import
+time exceeds its ``max_import_ms``, when any of its ``forbidden`` modules
+(dependencies only other pages need) was imported, or when it raises.
+
+    python -m services.import_budget                     # check every page
+    python -m services.import_budget pages/4_About.py    # check one page
+    python -m services.import_budget --update            # re-record max_import_ms
+
+Each page is measured IMPORT_BUDGET_RUNS times (default 3) and the fastest
+run counts, which keeps scheduler and disk-cache noise out of the check.
+The budgets are only meaningful for the dependency set they were recorded
+with: CI installs requirements.txt under .github/import-budget-constraints.txt,
+which pins Streamlit to the Space's ``sdk_version``. Re-record with
+``--update`` in that environment whenever the constraints change.
+numpy, pandas, pyarrow, PIL and plotly are not forbidden anywhere: Streamlit
+1.30 imports all of them on ``import streamlit``, so no page can avoid them.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET_PATH = Path(__file__).resolve().parent.parent / "import_budget.json"
+# Headroom applied to the measured time when re-recording the budget; the fixed
+# slack keeps pages that import almost nothing from failing on runner noise
+UPDATE_HEADROOM = 1.25
+UPDATE_SLACK_MS = 50
+RUNS = int(os.getenv("IMPORT_BUDGET_RUNS", "3"))
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+# Written to stderr once Streamlit is loaded; imports before it are not the page's
+_MARKER = "-- import budget: page starts --"
+
+# Runs one page under AppTest and exits non-zero with its exception, if any
+_RUNNER = (
+    "import sys\n"
+    "from streamlit.testing.v1 import AppTest\n"
+    f"print({_MARKER!r}, file=sys.stderr, flush=True)\n"
+    "app = AppTest.from_file(sys.argv[1], default_timeout=600).run()\n"
+    "if app.exception:\n"
+    "    sys.exit('\\n'.join(e.message + '\\n' + '\\n'.join(e.stack_trace) for e in app.exception))\n"
+)
+
+
+def parse_importtime(log):
+    """Return ``(total_ms, modules)`` from ``-X importtime`` output after the page marker."""
+    log = log.split(_MARKER, 1)[-1]
+    total_us = 0
+    modules = set()
+    for line in log.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, module = match.groups()
+        modules.add(module)
+        # Top-level imports (one space of indent) already include their children
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def measure_once(entry, root):
+    env = dict(os.environ)
+    # Pages under pages/ import shared modules from the project root
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(root), env.get("PYTHONPATH")]))
+    # The app copies these into os.environ and cannot start without them
+    for key in ("SERPER_API_KEY", "OPENAI_API_KEY"):
+        env.setdefault(key, "import-budget")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUNNER, str(Path(root) / entry)],
+        cwd=root, env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{entry} failed to run:\n{completed.stderr[-4000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def measure(entry, root, runs=RUNS):
+    """Best ``(total_ms, modules)`` of ``runs`` cold starts of ``entry``."""
+    return min((measure_once(entry, root) for _ in range(max(1, runs))), key=lambda result: result[0])
+
+
+def check_page(entry, page_budget, root, update=False):
+    """Measure one page; return True when it is within budget."""
+    total_ms, modules = measure(entry, root)
+    loaded = sorted({
+        name for name in page_budget["forbidden"]
+        if name in modules or any(module.startswith(name + ".") for module in modules)
+    })
+
+    if update:
+        page_budget["max_import_ms"] = round(total_ms * UPDATE_HEADROOM + UPDATE_SLACK_MS)
+
+    print(f"{entry}: {total_ms:.0f} ms of imports, {len(modules)} modules "
+          f"(budget {page_budget['max_import_ms']} ms)")
+    ok = True
+    if loaded:
+        print(f"  FAIL: modules this page should not load: {', '.join(loaded)}")
+        ok = False
+    if total_ms > page_budget["max_import_ms"]:
+        print(f"  FAIL: import time {total_ms:.0f} ms exceeds budget of {page_budget['max_import_ms']} ms")
+        ok = False
+    return ok
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    update = "--update" in argv
+    budget = json.loads(BUDGET_PATH.read_text())
+    entries = [arg for arg in argv if not arg.startswith("--")] or list(budget["pages"])
+
+    failed = [
+        entry for entry in entries
+        if not check_page(entry, budget["pages"][entry], BUDGET_PATH.parent, update)
+    ]
+    if update:
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"Recorded budgets in {BUDGET_PATH.name}")
+    return 1 if failed and not update else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def make_job_id(*parts):
+    """Derive a stable job id from the inputs of a run.
+
+    Submitting the same inputs twice (double click, rerun) yields the same id,
+    so the job manager can hand back the existing job instead of starting a
+    duplicate crew.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class Job:
+    """State of a single background run, safe to read from the UI thread."""
+
+    def __init__(self, job_id, meta=None):
+        self.id = job_id
+        self.meta = meta or {}
+        self.status = "queued"  # queued | running | done | failed
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        # Completion times of steps reported while the job runs, e.g. one per crew task
+        self.steps = {}
+        # Partial output of steps still in progress, e.g. streamed LLM tokens
+        self.live = {}
+
+    def record_step(self, key):
+        """Record that a step finished so the UI can report it before the job completes."""
+        self.steps[key] = {"finished_at": time.time()}
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def elapsed(self):
+        start = self.started_at or self.submitted_at
+        end = self.finished_at or time.time()
+        return end - start
+
+
+class JobManager:
+    """Runs long crew kickoffs on a bounded worker pool, keyed by job id.
+
+    Jobs outlive the Streamlit script run that submitted them, so a rerun or a
+    reloaded page can reattach to a job by id and poll its status.
+    """
+
+    def __init__(self, max_workers=4, retention_seconds=6 * 3600):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mediassist-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self.retention_seconds = retention_seconds
+
+    def submit(self, job_id, fn, *args, meta=None, **kwargs):
+        """Start ``fn`` under ``job_id`` unless a live or finished job already has that id.
+
+        ``fn`` receives the Job as its first argument so it can report progress
+        through ``job.record_step``. Failed jobs are replaced so that the user
+        can retry.
+        """
+        with self._lock:
+            self._evict_expired()
+            job = self._jobs.get(job_id)
+            if job is not None and job.status != "failed":
+                return job
+            job = Job(job_id, meta=meta)
+            self._jobs[job_id] = job
+            self._executor.submit(self._run, job, fn, args, kwargs)
+            return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_count(self):
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if job.active)
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status = "done"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+
+    def _evict_expired(self):
+        cutoff = time.time() - self.retention_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if not job.active and job.finished_at and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
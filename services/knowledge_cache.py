@@ -0,0 +1,184 @@
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+# Common lay terms and abbreviations mapped to the canonical (normalized) term
+TERM_SYNONYMS = {
+    "high blood pressure": "hypertension",
+    "htn": "hypertension",
+    "low blood pressure": "hypotension",
+    "heart attack": "myocardial infarction",
+    "mi": "myocardial infarction",
+    "cva": "stroke",
+    "diabetes mellitus": "diabetes",
+    "high blood sugar": "hyperglycemia",
+    "low blood sugar": "hypoglycemia",
+    "high cholesterol": "hypercholesterolemia",
+    "flu": "influenza",
+    "copd": "chronic obstructive pulmonary disease",
+    "gerd": "gastroesophageal reflux disease",
+    "acid reflux": "gastroesophageal reflux disease",
+    "uti": "urinary tract infection",
+    "tb": "tuberculosis",
+    "afib": "atrial fibrillation",
+    "a fib": "atrial fibrillation",
+    "covid": "covid 19",
+    "coronavirus": "covid 19",
+    "sar cov 2": "covid 19",
+    "adhd": "attention deficit hyperactivity disorder",
+    "migraine headache": "migraine"
+}
+
+# Condition names that end in "s" but are not plurals
+SINGULAR_TERMS = {
+    "diabetes", "rabies", "herpes", "measles", "mumps", "scabies", "rickets", "shingles",
+    "lupus", "tetanus", "aids", "sars", "hiv", "graves", "crohns", "hepatitis", "caries",
+    "hives"
+}
+
+# Plurals in "-ses" and "-ves" whose singular no suffix rule gets right
+IRREGULAR_PLURALS = {
+    "viruses": "virus",
+    "sinuses": "sinus",
+    "fetuses": "fetus",
+    "diagnoses": "diagnosis",
+    "prognoses": "prognosis",
+    "psychoses": "psychosis",
+    "thromboses": "thrombosis",
+    "stenoses": "stenosis",
+    "calves": "calf",
+    "nerves": "nerve",
+    "valves": "valve"
+}
+
+
+def _singularize(word):
+    if word in SINGULAR_TERMS or len(word) <= 3:
+        return word
+    if word in IRREGULAR_PLURALS:
+        return IRREGULAR_PLURALS[word]
+    # "headaches", "backaches": the singular ends in "-ache", so only the "s" goes
+    if word.endswith("aches"):
+        return word[:-1]
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith(("ches", "shes", "xes", "sses")):
+        return word[:-2]
+    # "-ses" and "-ves" are ambiguous ("causes"/"viruses", "valves"/"calves"): keep them
+    if word.endswith(("ses", "ves")):
+        return word
+    if word.endswith("s") and not word.endswith(("ss", "is", "us", "os", "as")):
+        return word[:-1]
+    return word
+
+
+def normalize_term(term):
+    """Normalize a search term so that equivalent searches share a cache entry.
+
+    Lower-cases, drops apostrophes and punctuation, collapses whitespace,
+    singularizes plurals and maps common synonyms to one canonical term, e.g.
+    "High  Blood-Pressure" and "hypertension" both become "hypertension".
+    """
+    term = term.lower().replace("'", "").replace("’", "")
+    term = re.sub(r"[^a-z0-9]+", " ", term).strip()
+    term = TERM_SYNONYMS.get(term, term)
+    term = " ".join(_singularize(word) for word in term.split())
+    return TERM_SYNONYMS.get(term, term)
+
+
+DAY = 24 * 3600
+
+# How long each knowledge section stays fresh. Definitions barely change, while
+# recent advances go stale within months.
+SECTION_TTLS = {
+    "definition": 730 * DAY,
+    "clinical_presentation": 365 * DAY,
+    "diagnostic_approach": 180 * DAY,
+    "treatment_options": 90 * DAY,
+    "recent_advances": 30 * DAY,
+    "references": 90 * DAY
+}
+
+
+class KnowledgeCache:
+    """Parsed Medical Knowledge results in SQLite, keyed by normalized search term.
+
+    Every section is stored with its own timestamp, so an entry can be served
+    while only its expired sections (per ``SECTION_TTLS``) are regenerated.
+    """
+
+    def __init__(self, path, section_ttls=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.section_ttls = section_ttls or SECTION_TTLS
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS knowledge_terms ("
+            "term_key TEXT PRIMARY KEY, term TEXT, created_at REAL, hits INTEGER DEFAULT 0)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS knowledge_sections ("
+            "term_key TEXT, section TEXT, content TEXT, updated_at REAL, "
+            "PRIMARY KEY (term_key, section))"
+        )
+        self._conn.commit()
+
+    def get(self, term_key):
+        """Return the cached entry for ``term_key`` or None if the term was never searched.
+
+        The entry is ``{"term", "sections", "updated_at", "stale"}`` where
+        ``stale`` lists sections that are expired or were never fetched. A
+        section that was fetched but came back empty keeps its timestamp, so
+        it is retried once its TTL expires rather than on every hit.
+        """
+        with self._lock:
+            term_row = self._conn.execute(
+                "SELECT term FROM knowledge_terms WHERE term_key = ?", (term_key,)
+            ).fetchone()
+            if term_row is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT section, content, updated_at FROM knowledge_sections WHERE term_key = ?", (term_key,)
+            ).fetchall()
+            self._conn.execute("UPDATE knowledge_terms SET hits = hits + 1 WHERE term_key = ?", (term_key,))
+            self._conn.commit()
+
+        now = time.time()
+        sections = {section: "" for section in self.section_ttls}
+        updated_at = {}
+        for section, content, updated in rows:
+            sections[section] = content
+            updated_at[section] = updated
+        stale = [
+            section for section, ttl in self.section_ttls.items()
+            if section not in updated_at or now - updated_at[section] > ttl
+        ]
+        return {"term": term_row[0], "sections": sections, "updated_at": updated_at, "stale": stale}
+
+    def put(self, term_key, term, sections):
+        """Store a full search result, stamping every section as fresh."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO knowledge_terms (term_key, term, created_at, hits) VALUES (?, ?, ?, 0)",
+                (term_key, term, time.time())
+            )
+            self._write_sections(term_key, sections)
+            self._conn.commit()
+
+    def update_sections(self, term_key, sections):
+        """Replace only the given sections of an existing entry."""
+        with self._lock:
+            self._write_sections(term_key, sections)
+            self._conn.commit()
+
+    def _write_sections(self, term_key, sections):
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO knowledge_sections (term_key, section, content, updated_at) VALUES (?, ?, ?, ?)",
+            [(term_key, section, content, now) for section, content in sections.items()]
+        )
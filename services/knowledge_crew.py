@@ -0,0 +1,134 @@
+"""Medical knowledge crew factory.
+
+The knowledge search and section-refresh crews are only needed when a
+search misses the knowledge cache or finds expired sections, so they are
+built here, inside the single-flight leader's worker, instead of on every
+load of the Medical Knowledge page. Callers sharing a flight never build one.
+"""
+from crewai import Crew, Process, Task
+
+from services.registry import agents_for_run
+from ui.knowledge import KNOWLEDGE_SECTION_HEADERS
+
+RESEARCH_DESCRIPTION = (
+    "1. Search for comprehensive information about: {term}\n"
+    "2. Include information from authoritative medical sources\n"
+    "3. Find details about:\n"
+    "   - Definition and pathophysiology\n"
+    "   - Clinical presentation\n"
+    "   - Diagnostic criteria\n"
+    "   - Treatment guidelines\n"
+    "   - Recent research findings\n"
+    "4. Return raw search results with sources"
+)
+
+EVALUATION_DESCRIPTION = (
+    "1. Review the research findings about {term}\n"
+    "2. Evaluate the quality of each source\n"
+    "3. Identify the most reliable and relevant information\n"
+    "4. Filter out outdated or low-quality sources\n"
+    "5. Highlight any controversies or conflicting evidence"
+)
+
+SYNTHESIS_DESCRIPTION = (
+    "1. Organize the validated information about {term} into clear sections with these exact headers:\n"
+    "   - ## DEFINITION: Definition and Overview\n"
+    "   - ## CLINICAL PRESENTATION: Clinical Presentation\n"
+    "   - ## DIAGNOSTIC APPROACH: Diagnostic Approach\n"
+    "   - ## TREATMENT OPTIONS: Treatment Options\n"
+    "   - ## RECENT ADVANCES: Recent Advances\n"
+    "   - ## REFERENCES: Key References\n"
+    "\n"
+    "2. For each section:\n"
+    "   - Start with a concise 2-3 sentence summary\n"
+    "   - Use bullet points for key features (- feature)\n"
+    "   - Bold important terms (**term**)\n"
+    "   - Separate concepts with blank lines\n"
+    "   - Keep paragraphs short (max 3 sentences)\n"
+    "\n"
+    "3. Example format:\n"
+    "   ## DEFINITION: \n"
+    "   [Brief 1-2 sentence definition]\n"
+    "\n"
+    "   **Key Characteristics:**\n"
+    "   - Characteristic 1\n"
+    "   - Characteristic 2\n"
+    "   - Characteristic 3\n"
+    "\n"
+    "   [Additional details in short paragraphs]\n"
+    "\n"
+    "4. Use professional but accessible language"
+)
+
+REFRESH_DESCRIPTION = (
+    "1. Some sections of the medical knowledge summary about {term} are outdated.\n"
+    "2. Write updated versions of ONLY these sections, using these exact headers:\n"
+    "{headers}\n"
+    "3. Check current authoritative sources, especially for recent advances and references\n"
+    "4. For each section, start with a concise 2-3 sentence summary, use bullet points for\n"
+    "   key features and bold important terms\n"
+    "5. The outdated content, for reference:\n"
+    "{previous}"
+)
+
+
+def build_knowledge_crew(term, agents):
+    """Build the research -> evaluation -> synthesis crew for one search term.
+
+    ``agents`` are the cached prototypes from ``get_knowledge_agents`` (the
+    crew runs on copies of them). Returns ``(crew, tasks)`` with ``tasks``
+    keyed by task name in execution order.
+    """
+    research_task = Task(
+        description=RESEARCH_DESCRIPTION.format(term=term),
+        agent=agents["medical_research_agent"],
+        expected_output=f"A comprehensive collection of information about {term} from medical sources"
+    )
+
+    evaluation_task = Task(
+        description=EVALUATION_DESCRIPTION.format(term=term),
+        agent=agents["evidence_evaluator"],
+        expected_output=f"An evaluation of the quality and reliability of information about {term}",
+        context=[research_task]
+    )
+
+    synthesis_task = Task(
+        description=SYNTHESIS_DESCRIPTION.format(term=term),
+        agent=agents["knowledge_synthesizer"],
+        expected_output="A well-structured medical knowledge summary with clear sectioning and formatting",
+        context=[evaluation_task]
+    )
+
+    tasks = {"research": research_task, "evaluation": evaluation_task, "synthesis": synthesis_task}
+    crew = Crew(
+        agents=agents_for_run(list(tasks.values())),
+        tasks=list(tasks.values()),
+        verbose=True,
+        process=Process.sequential
+    )
+    return crew, tasks
+
+
+def build_refresh_crew(term, stale_sections, current_sections, agents, search_tool):
+    """Build a one-task crew that rewrites only ``stale_sections`` of a cached entry.
+
+    Returns ``(crew, task)``.
+    """
+    headers = "\n".join(f"   - ## {KNOWLEDGE_SECTION_HEADERS[key]}:" for key in stale_sections)
+    previous = "\n\n".join(
+        f"## {KNOWLEDGE_SECTION_HEADERS[key]}:\n{current_sections[key]}"
+        for key in stale_sections if current_sections.get(key)
+    )
+    refresh_task = Task(
+        description=REFRESH_DESCRIPTION.format(term=term, headers=headers, previous=previous or "(none)"),
+        agent=agents["knowledge_synthesizer"],
+        tools=[search_tool],
+        expected_output="Updated versions of the requested knowledge sections under their exact headers"
+    )
+    crew = Crew(
+        agents=agents_for_run([refresh_task]),
+        tasks=[refresh_task],
+        verbose=True,
+        process=Process.sequential
+    )
+    return crew, refresh_task
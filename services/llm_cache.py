@@ -0,0 +1,109 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class LLMResponseCache:
+    """Content-addressed store of LLM responses in SQLite.
+
+    Entries are keyed by a hash of the model, its sampling parameters and the
+    full message list. Expired entries (``ttl_seconds``) are dropped on read,
+    and the least recently used entries are evicted once the cache exceeds
+    ``max_entries`` rows or ``max_bytes`` of response text.
+    """
+
+    def __init__(self, path, max_entries=5000, max_bytes=50 * 1024 * 1024, ttl_seconds=7 * 24 * 3600):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT, "
+            "created_at REAL, last_access REAL, hits INTEGER DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_last_access ON llm_cache(last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model, params, messages, tools=None):
+        payload = json.dumps(
+            {"model": model, "params": params, "messages": messages, "tools": tools},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, model, response):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, response, created_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, 0)",
+                (key, model, response, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0) FROM llm_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size
+        }
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def _evict(self):
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0) FROM llm_cache"
+        ).fetchone()
+        while entries > self.max_entries or (size > self.max_bytes and entries > 1):
+            key, length = self._conn.execute(
+                "SELECT key, LENGTH(response) FROM llm_cache ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            entries -= 1
+            size -= length or 0
@@ -0,0 +1,264 @@
+"""Process-wide resources shared by every page and session.
+
+Each getter is an ``st.cache_resource``, so a resource is built once per
+process no matter which page asks for it first. Heavy dependencies are
+imported inside the getters that need them.
+"""
+import os
+from pathlib import Path
+
+import streamlit as st
+
+from services.consultation_store import ConsultationStore
+from services.jobs import JobManager
+from services.knowledge_cache import KnowledgeCache
+from services.llm_cache import LLMResponseCache
+from services.results_bus import ResultsBus
+from services.singleflight import SingleFlight
+
+# Task outputs live in memory; set PERSIST_TASK_OUTPUTS=1 to also write them
+# to task_outputs/<run id>/ in the background
+output_dir = Path("task_outputs")
+
+# Background consultation jobs are shared by every session in this process
+@st.cache_resource
+def get_job_manager():
+    return JobManager(max_workers=int(os.getenv("CONSULTATION_WORKERS", "4")))
+
+# Per-run task outputs, shared by every session in this process
+@st.cache_resource
+def get_results_bus():
+    persist = os.getenv("PERSIST_TASK_OUTPUTS", "").lower() in ("1", "true", "yes")
+    return ResultsBus(persist_dir=output_dir if persist else None)
+
+# Finished consultation results by run id, shared across sessions and restarts
+# and deleted after CONSULTATION_RETENTION_SECONDS
+@st.cache_resource
+def get_consultation_store():
+    return ConsultationStore(
+        os.getenv("CONSULTATION_STORE_PATH", ".cache/consultations.sqlite3"),
+        ttl_seconds=int(os.getenv("CONSULTATION_RETENTION_SECONDS", str(30 * 24 * 3600)))
+    )
+
+# Parsed Medical Knowledge results, shared across sessions and restarts
+@st.cache_resource
+def get_knowledge_cache():
+    return KnowledgeCache(os.getenv("KNOWLEDGE_CACHE_PATH", ".cache/knowledge_cache.sqlite3"))
+
+# Process-wide coalescing of identical in-flight knowledge searches
+@st.cache_resource
+def get_knowledge_flights():
+    return SingleFlight(max_workers=int(os.getenv("KNOWLEDGE_WORKERS", "4")))
+
+# Shared LLM response cache; LLM_CACHE=0 disables it
+@st.cache_resource
+def get_llm_cache():
+    if os.getenv("LLM_CACHE", "1").lower() in ("0", "false", "no"):
+        return None
+    return LLMResponseCache(
+        os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite3"),
+        max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000")),
+        ttl_seconds=int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    )
+
+# Initialize LLM
+# llm = LLM(model="openai/gpt-4o-mini", temperature=0.7, api_key=os.environ["OPENAI_API_KEY"])
+LLM_MODEL = "gpt-4o-mini"
+
+# Agent tools, shared by every session in this process; imports the agent stack on first use
+@st.cache_resource
+def get_agent_tools():
+    from crewai_tools import ScrapeWebsiteTool
+    from services.http_pool import install_http_pool
+    from tools.resilient_search import ResilientSerperDevTool
+
+    # Share keep-alive connection pools between all tools and the LLM client
+    install_http_pool()
+    return ResilientSerperDevTool(), ScrapeWebsiteTool()
+
+# Base LLM client for agents, shared by every session in this process
+@st.cache_resource
+def get_llm():
+    from langchain_openai import ChatOpenAI
+
+    # crewai converts this client into its own LiteLLM-backed LLM, so token
+    # streaming is enabled per run instead: each agent gets a streaming LLM bound
+    # to a StreamBuffer (see services/streaming.py) when its crew is kicked off.
+    return ChatOpenAI(model = LLM_MODEL)
+
+# Consultation agent prototypes, built once per process (runs use copies, see agents_for_run)
+@st.cache_resource
+def get_consultation_agents():
+    from crewai import Agent
+
+    search_tool, scrape_tool = get_agent_tools()
+    llm = get_llm()
+
+    # Define Agents with more detailed roles, goals, and delegation capabilities
+    primary_diagnostician = Agent(
+        role="Primary Medical Diagnostician",
+        goal="Coordinate the diagnostic process and generate accurate preliminary diagnoses based on patient information.",
+        backstory="""As the Primary Medical Diagnostician, you have extensive clinical experience and 
+        are responsible for coordinating the initial diagnostic process. You analyze patient symptoms, 
+        medical history, and vital signs to develop a comprehensive differential diagnosis. You're skilled at 
+        identifying patterns in symptoms and prioritizing potential conditions based on likelihood.""",
+        llm=llm,
+        verbose=True,
+        max_iter=2,
+        allow_delegation=True,
+        tools=[search_tool, scrape_tool]
+    )
+
+    specialist_diagnostician = Agent(
+        role="Specialist Diagnostician",
+        goal="Provide specialized expertise for complex or specific medical conditions based on the primary diagnostician's findings.",
+        backstory="""You are a medical specialist with deep expertise in complex conditions. When the primary 
+        diagnostician identifies potential specialized conditions, you provide in-depth analysis and expertise. 
+        Your specialized knowledge allows for more accurate diagnosis of complex or rare conditions.""",
+        llm=llm,
+        verbose=True,
+        max_iter=2,
+        allow_delegation=True,
+        tools=[search_tool, scrape_tool]
+    )
+
+    treatment_advisor = Agent(
+        role="Treatment Planning Specialist",
+        goal="Develop comprehensive, personalized treatment plans based on confirmed diagnoses and patient profiles.",
+        backstory="""As a Treatment Planning Specialist, you excel at creating individualized treatment strategies. 
+        You consider the diagnosis, patient profile, current medications, allergies, and best medical practices 
+        to develop appropriate treatment plans. Your recommendations are evidence-based and tailored to the 
+        specific needs of each patient.""",
+        llm=llm,
+        verbose=True,
+        max_iter=2,
+        allow_delegation=True,
+        tools=[search_tool, scrape_tool]
+    )
+
+    pharmacology_specialist = Agent(
+        role="Clinical Pharmacologist",
+        goal="Ensure medication safety by analyzing potential drug interactions and providing dosage guidance.",
+        backstory="""You are a clinical pharmacology expert who specializes in medication safety and efficacy. 
+        You analyze potential drug interactions, recommend appropriate dosages based on patient factors, 
+        and ensure that medication plans are both safe and effective. You can identify contraindications 
+        and suggest alternatives when necessary.""",
+        llm=llm,
+        verbose=True,
+        allow_delegation=False,
+        max_iter=2,
+        tools=[search_tool, scrape_tool]
+    )
+
+    medical_researcher = Agent(
+        role="Medical Literature Researcher",
+        goal="Find and synthesize relevant medical research to support diagnosis and treatment recommendations.",
+        backstory="""You excel at searching medical databases and recent publications to find 
+        evidence-based information relevant to specific patient cases. You evaluate the quality 
+        of research and extract actionable insights to support medical decision-making. You ensure 
+        that all recommendations are backed by current medical literature.""",
+        llm=llm,
+        verbose=True,
+        allow_delegation=False,
+        max_iter=2,
+        tools=[search_tool, scrape_tool]
+    )
+
+    patient_educator = Agent(
+        role="Patient Education Specialist",
+        goal="Create clear, accessible education materials for patients about their condition and treatment.",
+        backstory="""You specialize in translating complex medical information into clear, 
+        actionable guidance for patients. You create educational materials that help patients 
+        understand their condition, treatment plan, and necessary lifestyle modifications. 
+        Your communication is empathetic, clear, and designed to improve treatment adherence.""",
+        llm=llm,
+        verbose=True,
+        allow_delegation=False,
+        max_iter=2,
+        tools=[search_tool, scrape_tool]
+    )
+
+    safety_officer = Agent(
+        role="Medical Safety Officer",
+        goal="Identify potential risks in diagnosis and treatment and provide safety alerts.",
+        backstory="""You are focused on patient safety in all aspects of care. You review diagnoses 
+        and treatment plans to identify potential risks, warning signs that require immediate attention, 
+        and safety precautions. Your role is to ensure that all recommendations prioritize patient safety 
+        and include appropriate monitoring and follow-up.""",
+        llm=llm,
+        verbose=True,
+        allow_delegation=False,
+        max_iter=2,
+        tools=[search_tool, scrape_tool]
+    )
+
+    return {
+        "primary_diagnostician": primary_diagnostician,
+        "specialist_diagnostician": specialist_diagnostician,
+        "treatment_advisor": treatment_advisor,
+        "pharmacology_specialist": pharmacology_specialist,
+        "medical_researcher": medical_researcher,
+        "patient_educator": patient_educator,
+        "safety_officer": safety_officer
+    }
+
+# Medical Knowledge agent prototypes, built once per process
+@st.cache_resource
+def get_knowledge_agents():
+    from crewai import Agent
+
+    search_tool, scrape_tool = get_agent_tools()
+    llm = get_llm()
+
+    # Define specialized agents for medical knowledge
+    medical_research_agent = Agent(
+        role="Medical Research Specialist",
+        goal="Find and summarize the most relevant medical information from trusted sources",
+        backstory="""You are an expert medical researcher with access to the latest clinical guidelines, 
+        research papers, and medical databases. You can quickly find and synthesize accurate medical 
+        information on any topic.""",
+        llm=llm,
+        verbose=True,
+        allow_delegation=False,
+        max_iter=2,
+        tools=[search_tool, scrape_tool]
+    )
+
+    evidence_evaluator = Agent(
+        role="Medical Evidence Evaluator",
+        goal="Evaluate the quality and relevance of medical evidence",
+        backstory="""You are a critical appraiser of medical evidence with expertise in evidence-based 
+        medicine. You assess the reliability, validity, and clinical relevance of medical information.""",
+        llm=llm,
+        verbose=True,
+        max_iter=2,
+        allow_delegation=False
+    )
+
+    knowledge_synthesizer = Agent(
+        role="Medical Knowledge Synthesizer",
+        goal="Create clear, organized summaries of medical information",
+        backstory="""You specialize in transforming complex medical information into clear, structured 
+        knowledge that's easy to understand. You organize information logically and highlight key points.""",
+        llm=llm,
+        verbose=True,
+        max_iter=2,
+        allow_delegation=False
+    )
+
+    return {
+        "medical_research_agent": medical_research_agent,
+        "evidence_evaluator": evidence_evaluator,
+        "knowledge_synthesizer": knowledge_synthesizer
+    }
+
+# Function to give a run private copies of the shared agents its tasks use.
+# crewai mutates agents while a crew runs (crew, executor, LLM), so cached
+# prototypes must never be kicked off directly.
+def agents_for_run(tasks):
+    copies = {}
+    for task in tasks:
+        if id(task.agent) not in copies:
+            copies[id(task.agent)] = task.agent.copy()
+        task.agent = copies[id(task.agent)]
+    return list(copies.values())
@@ -0,0 +1,135 @@
+import os
+import random
+import threading
+import time
+
+import requests
+
+# Statuses worth retrying: rate limiting and upstream/server trouble
+TRANSIENT_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling upstream while an endpoint's breaker is open."""
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff."""
+
+    def __init__(self, attempts=3, base_delay=0.2, max_delay=2.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+DEFAULT_POLICY = RetryPolicy(
+    attempts=int(os.getenv("HTTP_RETRY_ATTEMPTS", "3")),
+    base_delay=float(os.getenv("HTTP_RETRY_BASE_DELAY_SECONDS", "0.2")),
+    max_delay=float(os.getenv("HTTP_RETRY_MAX_DELAY_SECONDS", "2"))
+)
+
+
+def is_transient(error):
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in TRANSIENT_STATUSES
+    return False
+
+
+class CircuitBreaker:
+    """Fails fast after repeated failures of one endpoint.
+
+    After ``failure_threshold`` consecutive failed calls the breaker opens
+    and calls are rejected for ``reset_timeout`` seconds. The first call
+    after that is let through as a probe; its outcome closes or re-opens
+    the breaker.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.time() - self.opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.time() - self.opened_at < self.reset_timeout or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+            self._probing = False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(endpoint):
+    """The shared CircuitBreaker for ``endpoint``, created on first use."""
+    with _breakers_lock:
+        if endpoint not in _breakers:
+            _breakers[endpoint] = CircuitBreaker(
+                endpoint,
+                failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))
+            )
+        return _breakers[endpoint]
+
+
+def call_with_resilience(endpoint, fn, *args, policy=None, **kwargs):
+    """Call ``fn`` behind ``endpoint``'s circuit breaker, retrying transient errors.
+
+    Non-transient errors are raised at once. Transient ones are retried up
+    to the policy's attempt count, then raised and counted against the
+    breaker. While the breaker is open, CircuitOpenError is raised without
+    calling ``fn``.
+    """
+    policy = policy or DEFAULT_POLICY
+    breaker = breaker_for(endpoint)
+    if not breaker.allow():
+        raise CircuitOpenError(f"{endpoint} is temporarily unavailable (circuit open)")
+    for attempt in range(policy.attempts):
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if not is_transient(e):
+                # Not an availability problem, so it does not trip the breaker
+                breaker.record_success()
+                raise
+            if attempt == policy.attempts - 1:
+                breaker.record_failure()
+                raise
+            time.sleep(policy.delay(attempt))
+        else:
+            breaker.record_success()
+            return result
@@ -0,0 +1,46 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+class ResultsBus:
+    """Task outputs of each run, held in memory and keyed by run id.
+
+    Crew callbacks publish into the bus from worker threads and the UI reads
+    a run's outputs back without touching disk. When ``persist_dir`` is set,
+    outputs are additionally written to ``<persist_dir>/<run_id>/<task>.md`` on
+    a background writer thread so publishing never waits on I/O.
+    """
+
+    def __init__(self, persist_dir=None, max_runs=256):
+        self.max_runs = max_runs
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+        self._persist_dir = Path(persist_dir) if persist_dir else None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-writer") if persist_dir else None
+
+    def publish(self, run_id, task_name, output):
+        output = str(output)
+        with self._lock:
+            self._runs.setdefault(run_id, {})[task_name] = output
+            self._runs.move_to_end(run_id)
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+        if self._writer is not None:
+            self._writer.submit(self._persist, run_id, task_name, output)
+
+    def get(self, run_id):
+        """Return a copy of the outputs published so far for ``run_id``."""
+        with self._lock:
+            return dict(self._runs.get(run_id, {}))
+
+    def discard(self, run_id):
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def _persist(self, run_id, task_name, output):
+        run_dir = self._persist_dir / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        with open(run_dir / f"{task_name}.md", 'w', encoding='utf-8') as f:
+            f.write(output)
@@ -0,0 +1,48 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Flight:
+    """One in-flight call shared by every caller that asked for the same key."""
+
+    def __init__(self, key, future, context, leader):
+        self.key = key
+        self.future = future
+        # Whatever the leader attached for observers, e.g. live stream buffers
+        self.context = context
+        self.leader = leader
+
+
+class SingleFlight:
+    """Coalesces concurrent identical requests into one execution.
+
+    The first caller for a key starts ``fn`` on a shared worker pool; callers
+    arriving while it runs get the same Flight and wait on its future. The
+    work runs outside any Streamlit script thread, so a leader whose session
+    reruns or disconnects does not cancel it for the others.
+    """
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="single-flight")
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, context=None, **kwargs):
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return Flight(key, flight.future, flight.context, leader=False)
+            future = self._executor.submit(fn, *args, **kwargs)
+            flight = Flight(key, future, context, leader=True)
+            self._flights[key] = flight
+        future.add_done_callback(lambda _: self._forget(key, flight))
+        return flight
+
+    def in_flight(self):
+        with self._lock:
+            return list(self._flights)
+
+    def _forget(self, key, flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
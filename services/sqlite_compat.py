@@ -0,0 +1,6 @@
+# Swap in pysqlite3 for the standard library's sqlite3 module. Every page
+# imports this first, since a session can start on any page.
+import sys
+import importlib
+importlib.import_module('pysqlite3')
+sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
@@ -0,0 +1,66 @@
+import threading
+import time
+import weakref
+
+from crewai import LLM
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+
+from services.cached_llm import CachedLLM
+
+
+class StreamBuffer:
+    """Accumulates streamed tokens for one task; written by crew threads, read by the UI."""
+
+    def __init__(self, label=""):
+        self.label = label
+        self.updated_at = None
+        self._parts = []
+        self._lock = threading.Lock()
+
+    def append(self, chunk):
+        with self._lock:
+            self._parts.append(chunk)
+            self.updated_at = time.time()
+
+    def text(self):
+        with self._lock:
+            return "".join(self._parts)
+
+    def tail(self, max_chars=2000):
+        text = self.text()
+        return text if len(text) <= max_chars else "…" + text[-max_chars:]
+
+
+# crewai reports every streamed chunk on its global event bus with the
+# emitting LLM as the source, so each streaming LLM maps to one buffer.
+_routes = weakref.WeakKeyDictionary()
+_routes_lock = threading.Lock()
+
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _route_chunk(source, event):
+    with _routes_lock:
+        buffer = _routes.get(source)
+    if buffer is not None:
+        buffer.append(event.chunk)
+
+
+def streaming_llm(buffer, model="gpt-4o-mini", cache=None, **kwargs):
+    """Create a streaming LLM whose tokens are appended to ``buffer``.
+
+    With an LLMResponseCache, repeated prompts are answered from the cache.
+    """
+    if cache is not None:
+        llm = CachedLLM(model=model, stream=True, cache=cache, **kwargs)
+    else:
+        llm = LLM(model=model, stream=True, **kwargs)
+    with _routes_lock:
+        _routes[llm] = buffer
+    return llm
+
+
+def bind_streaming(agent, buffer, model="gpt-4o-mini", cache=None):
+    """Give ``agent`` its own streaming LLM so its tokens can be told apart from other agents'."""
+    agent.llm = streaming_llm(buffer, model=model, cache=cache)
+    return agent
@@ -0,0 +1,25 @@
+import time
+
+from services.consultation_store import ConsultationStore
+
+
+def test_round_trip(tmp_path):
+    store = ConsultationStore(tmp_path / "consultations.sqlite3")
+    store.save("run-1", {"patient_name": "A"}, {"diagnosis": "d"}, started_at=1.0, finished_at=time.time())
+
+    record = store.get("run-1")
+    assert record["meta"] == {"patient_name": "A"}
+    assert record["results"] == {"diagnosis": "d"}
+    assert store.get("run-2") is None
+
+
+def test_expired_runs_are_hidden_and_deleted(tmp_path):
+    path = tmp_path / "consultations.sqlite3"
+    store = ConsultationStore(path, ttl_seconds=60)
+    store.save("old", {}, {}, started_at=0.0, finished_at=time.time() - 120)
+    assert store.get("old") is None
+
+    store.save("new", {}, {}, started_at=0.0)
+    count = store._conn.execute("SELECT COUNT(*) FROM consultations").fetchone()[0]
+    assert count == 1
+    assert store.get("new") is not None
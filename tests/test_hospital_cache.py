@@ -0,0 +1,31 @@
+from tools.hospital_cache import HospitalSearchCache
+
+
+def test_fetch_radius_covers_neighbouring_queries():
+    cache = HospitalSearchCache()
+    bucket = cache.fetch_radius(40.0, -74.0, 5000)
+    cache.store(40.0, -74.0, bucket, [{"name": "A"}])
+
+    # About 3 km away, in another cell, with the tool's default radius
+    assert cache.lookup(40.02, -74.03, 5000) == [{"name": "A"}]
+    assert cache.lookup(40.0, -74.0, 1609) == [{"name": "A"}]
+
+
+def test_entries_are_per_query_set():
+    cache = HospitalSearchCache()
+    cache.store(40.0, -74.0, cache.fetch_radius(40.0, -74.0, 5000), [{"name": "A"}], queries=("hospital",))
+    assert cache.lookup(40.0, -74.0, 5000, queries=("cardiology hospital",)) is None
+
+
+def test_partial_entries_expire_sooner(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("tools.hospital_cache.time.time", lambda: now[0])
+    cache = HospitalSearchCache(ttl_seconds=3600, partial_ttl_seconds=60)
+    cache.store(40.0, -74.0, 5000, [{"name": "A"}])
+    cache.store(41.0, -74.0, 5000, [{"name": "B"}], partial=True)
+
+    now[0] += 120
+    assert cache.lookup(40.0, -74.0, 5000) == [{"name": "A"}]
+    assert cache.lookup(41.0, -74.0, 5000) is None
+    # Still usable as a stale fallback while upstream is down
+    assert cache.lookup(41.0, -74.0, 5000, allow_stale=True) == [{"name": "B"}]
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from tools.hospital_models import RecommendationReasons, extract_json, iter_json, parse_model
+
+
+def test_extract_json_ignores_surrounding_prose():
+    text = 'Here you go:\n```json\n{"reasons": {"A": "close, \\"24/7\\" ER"}}\n```\nHope this helps.'
+    assert extract_json(text) == {"reasons": {"A": 'close, "24/7" ER'}}
+
+
+def test_stray_quote_before_json_does_not_hide_it():
+    assert extract_json('"quote {x" {"a": 1}') == {"a": 1}
+
+
+def test_unbalanced_bracket_before_json_does_not_hide_it():
+    assert extract_json('as noted (see [1 and {"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_iter_json_yields_every_candidate():
+    assert list(iter_json('see [1], then {"a": 1} and [2]')) == [[1], {"a": 1}, [2]]
+
+
+def test_parse_model_skips_candidates_that_do_not_validate():
+    output = SimpleNamespace(pydantic=None, json_dict=None, raw='As cited [1]: {"reasons": {"A": "nearest ER"}}')
+    parsed = parse_model(RecommendationReasons, output)
+    assert parsed.reasons == {"A": "nearest ER"}
+
+
+def test_parse_model_without_json():
+    assert parse_model(RecommendationReasons, "no json here") is None
+
+
+def test_parse_model_falls_back_to_raw_text_when_json_dict_does_not_validate():
+    output = SimpleNamespace(pydantic=None, json_dict={"reasons": ["not", "a", "dict"]},
+                             raw='{"reasons": {"A": "nearest ER"}}')
+    assert parse_model(RecommendationReasons, output).reasons == {"A": "nearest ER"}
+
+
+def test_iter_json_skips_past_decoded_values():
+    assert list(iter_json('{"a": {"b": [1]}} [2]')) == [{"a": {"b": [1]}}, [2]]
+
+
+def test_deeply_nested_brackets_do_not_hide_json():
+    assert list(iter_json("[" * 5000 + '{"a": 1}')) == [{"a": 1}]
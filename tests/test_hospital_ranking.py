@@ -0,0 +1,32 @@
+import pytest
+
+from tools.hospital_ranking import build_recommendations, normalize_phone
+
+HOSPITAL = {"address": "1 Main St", "phone": "", "emergency": True, "longitude": -74.0, "reviews": 100}
+
+
+@pytest.mark.parametrize("phone, country_code, expected", [
+    ("(555) 123-4567", "", "(555) 123-4567"),
+    ("(555) 123-4567", "1", "+15551234567"),
+    ("1 (555) 123-4567", "1", "+15551234567"),
+    ("+1 555-123-4567", "", "+15551234567"),
+    ("0044 20 7946 0958", "", "+442079460958"),
+    ("020 7946 0958", "44", "+442079460958"),
+    ("", "1", "")
+])
+def test_normalize_phone(monkeypatch, phone, country_code, expected):
+    monkeypatch.delenv("DEFAULT_PHONE_COUNTRY_CODE", raising=False)
+    assert normalize_phone(phone, country_code) == expected
+
+
+def test_half_star_ratings_round_up():
+    search_result = {
+        "status": "success",
+        "user_coordinates": [40.0, -74.0],
+        "hospitals": [
+            dict(HOSPITAL, name="A", latitude=40.01, review_rating=4.5),
+            dict(HOSPITAL, name="B", latitude=40.02, review_rating=2.5)
+        ]
+    }
+    ratings = {h.name: h.rating for h in build_recommendations(search_result, radius_miles=10).hospitals}
+    assert ratings == {"A": 5, "B": 3}
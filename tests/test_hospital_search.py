@@ -0,0 +1,41 @@
+from tools import gethospitals
+from tools.gethospitals import HospitalSearchByCoordinatesTool
+from tools.hospital_cache import HospitalSearchCache
+
+
+def fake_serpapi(failing_query):
+    def search(params):
+        if params["q"] == failing_query:
+            raise ConnectionError("upstream down")
+        return {"local_results": [{
+            "title": f"{params['q']} {params['start']}",
+            "address": "1 Main St",
+            "gps_coordinates": {"latitude": 40.0, "longitude": -74.0}
+        }]}
+    return search
+
+
+def test_partial_results_are_flagged_and_cached_briefly(monkeypatch):
+    cache = HospitalSearchCache(partial_ttl_seconds=60)
+    monkeypatch.setattr(gethospitals, "local_hospital_index", None)
+    monkeypatch.setattr(gethospitals, "hospital_search_cache", cache)
+    monkeypatch.setattr(gethospitals, "serpapi_search", fake_serpapi("emergency room"))
+
+    result = HospitalSearchByCoordinatesTool()._run(40.0, -74.0, radius=5000, limit=10, specialty=None, emergency_only=False)
+    assert result["status"] == "success"
+    assert result["partial"] is True
+    assert {hospital["query"] for hospital in result["hospitals"]} == {"hospitals"}
+    entry, = cache._entries.values()
+    assert entry["partial"] and entry["ttl"] == 60
+
+
+def test_complete_results_use_the_full_ttl(monkeypatch):
+    cache = HospitalSearchCache(ttl_seconds=3600)
+    monkeypatch.setattr(gethospitals, "local_hospital_index", None)
+    monkeypatch.setattr(gethospitals, "hospital_search_cache", cache)
+    monkeypatch.setattr(gethospitals, "serpapi_search", fake_serpapi(None))
+
+    result = HospitalSearchByCoordinatesTool()._run(40.0, -74.0, radius=5000, limit=10, specialty=None, emergency_only=False)
+    assert result["partial"] is False
+    entry, = cache._entries.values()
+    assert not entry["partial"] and entry["ttl"] == 3600
@@ -0,0 +1,77 @@
+import numpy as np
+
+from tools.geo import haversine_m_vec
+from tools.hospital_index import HospitalIndex
+from tools.hospital_store import HospitalStore, compile_hospital_store
+
+
+def make_records(count, seed=7):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "name": f"Hospital {i} é",
+            "address": f"{i} Main St",
+            "phone": f"+1555000{i:04d}",
+            "emergency": bool(i % 3 == 0),
+            "latitude": float(40.0 + rng.uniform(-0.5, 0.5)),
+            "longitude": float(-74.0 + rng.uniform(-0.5, 0.5))
+        }
+        for i in range(count)
+    ]
+
+
+def test_round_trip_preserves_every_field(tmp_path):
+    records = [
+        {"name": "A é", "address": "B", "phone": "x", "emergency": True, "latitude": 1.0, "longitude": 2.0},
+        {"name": "C", "address": "Dé", "phone": "", "emergency": False, "latitude": -3.5, "longitude": 179.9}
+    ]
+    path = tmp_path / "hospitals.hstore"
+    assert compile_hospital_store(records, path) == 2
+
+    store = HospitalStore(path)
+    loaded = sorted((store.record(i) for i in range(len(store))), key=lambda r: r["name"])
+    assert loaded[0] == records[0]
+    assert loaded[1] == dict(records[1], phone="")
+
+
+def test_store_index_matches_brute_force(tmp_path):
+    records = make_records(500)
+    path = tmp_path / "hospitals.hstore"
+    compile_hospital_store(records, path)
+    index = HospitalIndex.from_store(HospitalStore(path))
+
+    latitudes = np.array([r["latitude"] for r in records])
+    longitudes = np.array([r["longitude"] for r in records])
+    for radius in (500, 5000, 20000):
+        distances = haversine_m_vec(40.1, -73.9, latitudes, longitudes)
+        expected = [records[i]["name"] for i in np.argsort(distances) if distances[i] <= radius][:10]
+        hits = index.nearest(40.1, -73.9, radius, 10)
+        assert [record["name"] for record, _ in hits] == expected
+        assert all(distance <= radius for _, distance in hits)
+
+
+def test_in_memory_index_matches_store_index(tmp_path):
+    records = make_records(200, seed=3)
+    path = tmp_path / "hospitals.hstore"
+    compile_hospital_store(records, path)
+
+    from_store = HospitalIndex.from_store(HospitalStore(path)).nearest(40.0, -74.0, 15000, 25)
+    from_records = HospitalIndex.from_records(records).nearest(40.0, -74.0, 15000, 25)
+    assert from_store == from_records
+
+
+def test_empty_store(tmp_path):
+    path = tmp_path / "empty.hstore"
+    compile_hospital_store([], path)
+    assert HospitalIndex.from_store(HospitalStore(path)).nearest(0.0, 0.0, 1000, 5) == []
+
+
+def test_emergency_only_counts_only_emergency_departments(tmp_path):
+    records = make_records(300, seed=11)
+    path = tmp_path / "hospitals.hstore"
+    compile_hospital_store(records, path)
+
+    for index in (HospitalIndex.from_store(HospitalStore(path)), HospitalIndex.from_records(records)):
+        hits = index.nearest(40.0, -74.0, 50000, 10, emergency_only=True)
+        assert len(hits) == 10
+        assert all(record["emergency"] for record, _ in hits)
@@ -0,0 +1,35 @@
+import http.server
+import threading
+
+import pytest
+
+from services.http_pool import http_session
+
+
+@pytest.fixture
+def cookie_server():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Set-Cookie", "sid=abc; Path=/")
+            self.end_headers()
+            self.wfile.write((self.headers.get("Cookie") or "").encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+
+
+def test_shared_session_never_keeps_cookies(cookie_server):
+    session = http_session()
+    session.get(cookie_server)
+    assert session.get(cookie_server).text == ""
+    assert len(session.cookies) == 0
+
+
+def test_explicit_cookies_still_apply(cookie_server):
+    assert http_session().get(cookie_server, cookies={"x": "1"}).text == "x=1"
@@ -0,0 +1,64 @@
+import pytest
+
+from services.knowledge_cache import SECTION_TTLS, KnowledgeCache, normalize_term
+
+
+@pytest.mark.parametrize("plural, singular", [
+    ("headaches", "headache"),
+    ("toothaches", "toothache"),
+    ("backaches", "backache"),
+    ("allergies", "allergy"),
+    ("rashes", "rash"),
+    ("migraines", "migraine"),
+    ("kidney stones", "kidney stone"),
+    ("viruses", "virus"),
+    ("sinuses", "sinus"),
+    ("abscesses", "abscess"),
+    ("diagnoses", "diagnosis"),
+    ("calves", "calf")
+])
+def test_plurals_share_the_singular_entry(plural, singular):
+    assert normalize_term(plural) == normalize_term(singular) == singular
+
+
+@pytest.mark.parametrize("term", ["caries", "diabetes", "measles", "herpes", "lupus", "hepatitis", "hives"])
+def test_singular_terms_ending_in_s_are_kept(term):
+    assert normalize_term(term) == term
+
+
+def test_punctuation_case_and_synonyms():
+    assert normalize_term("High  Blood-Pressure") == "hypertension"
+    assert normalize_term("Crohn's") == "crohns"
+    assert normalize_term("Migraine Headaches") == "migraine"
+
+
+def test_ambiguous_plurals_are_left_unchanged():
+    assert normalize_term("causes") == "causes"
+    assert normalize_term("leaves") == "leaves"
+
+
+def test_sugar_alone_is_not_diabetes():
+    assert normalize_term("sugar") == "sugar"
+    assert normalize_term("Low blood sugar") == "hypoglycemia"
+
+
+def test_empty_section_is_not_stale_within_its_ttl(tmp_path):
+    cache = KnowledgeCache(tmp_path / "knowledge.sqlite3")
+    sections = {section: f"{section} text" for section in SECTION_TTLS}
+    sections["references"] = ""
+    cache.put("asthma", "Asthma", sections)
+
+    entry = cache.get("asthma")
+    assert entry["stale"] == []
+    assert entry["sections"]["references"] == ""
+
+
+def test_expired_and_missing_sections_are_stale(tmp_path):
+    cache = KnowledgeCache(tmp_path / "knowledge.sqlite3", section_ttls={"definition": 3600, "references": -1})
+    cache.put("asthma", "Asthma", {"definition": "text", "references": "refs"})
+    cache.update_sections("asthma", {})
+    assert cache.get("asthma")["stale"] == ["references"]
+
+    cache = KnowledgeCache(tmp_path / "other.sqlite3", section_ttls={"definition": 3600, "references": 3600})
+    cache.put("asthma", "Asthma", {"definition": "text"})
+    assert cache.get("asthma")["stale"] == ["references"]
@@ -0,0 +1,80 @@
+import http.server
+import json
+import threading
+
+import pytest
+import requests
+
+from services import resilience
+from services.resilience import CircuitOpenError, RetryPolicy, breaker_for
+from tools import gethospitals
+from tools.gethospitals import HospitalSearchByCoordinatesTool, serpapi_search
+from tools.hospital_cache import HospitalSearchCache
+
+PLACE = {"title": "General Hospital", "address": "1 Main St",
+         "gps_coordinates": {"latitude": 40.001, "longitude": -74.0}}
+
+
+@pytest.fixture
+def serpapi(monkeypatch):
+    """Local SerpAPI stand-in: answers with the queued statuses, then ``default``."""
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.server.requests += 1
+            status = self.server.statuses.pop(0) if self.server.statuses else self.server.default
+            body = json.dumps({"local_results": [PLACE]} if status == 200 else {"error": "unavailable"})
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    server.statuses, server.default, server.requests = [], 200, 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(gethospitals, "SERPAPI_URL", f"http://127.0.0.1:{server.server_port}/search.json")
+    monkeypatch.setattr(resilience, "DEFAULT_POLICY", RetryPolicy(attempts=3, base_delay=0.001, max_delay=0.001))
+    monkeypatch.setattr(resilience, "_breakers", {})
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "2")
+    yield server
+    server.shutdown()
+
+
+def test_transient_error_is_retried(serpapi):
+    serpapi.statuses = [503]
+    assert serpapi_search({"q": "hospitals"}) == {"local_results": [PLACE]}
+    assert serpapi.requests == 2
+    assert breaker_for("serpapi").state == "closed"
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(serpapi):
+    serpapi.default = 503
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            serpapi_search({"q": "hospitals"})
+    assert serpapi.requests == 6
+    assert breaker_for("serpapi").state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        serpapi_search({"q": "hospitals"})
+    assert serpapi.requests == 6
+
+
+def test_stale_cache_is_served_while_upstream_is_down(serpapi, monkeypatch):
+    # Entries expire at once, so every search misses and only the fallback can use them
+    monkeypatch.setattr(gethospitals, "hospital_search_cache", HospitalSearchCache(ttl_seconds=-1))
+    monkeypatch.setattr(gethospitals, "local_hospital_index", None)
+    tool = HospitalSearchByCoordinatesTool()
+    search = dict(latitude=40.0, longitude=-74.0, radius=5000, limit=5, specialty=None, emergency_only=False)
+
+    fresh = tool._run(**search)
+    assert fresh["status"] == "success" and not fresh["stale"]
+
+    serpapi.default = 503
+    result = tool._run(**search)
+    assert result["status"] == "success"
+    assert result["cached"] and result["stale"]
+    assert [hospital["name"] for hospital in result["hospitals"]] == ["General Hospital"]
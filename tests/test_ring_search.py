@@ -0,0 +1,43 @@
+import time
+
+from tools.gethospitals import expanding_ring_search
+
+
+class SlowTool:
+    """Fake search tool: hospitals every 1.5 km, emergency departments from 6 km out."""
+
+    def __init__(self, delay=0.3):
+        self.delay = delay
+        self.calls = []
+
+    def run(self, latitude, longitude, radius, limit, specialty=None, emergency_only=False):
+        self.calls.append(radius)
+        time.sleep(self.delay)
+        hospitals = [
+            {"name": f"H{d}", "distance_m": d, "emergency": d >= 6000}
+            for d in range(1500, 100000, 1500)
+            if d <= radius and (d >= 6000 or not emergency_only)
+        ][:limit]
+        return {"status": "success", "hospitals": hospitals, "count": len(hospitals),
+                "user_coordinates": [latitude, longitude]}
+
+
+def test_first_ring_arrives_before_the_wider_rings():
+    tool = SlowTool()
+    started = time.monotonic()
+    arrivals = []
+    for result in expanding_ring_search(tool, 0.0, 0.0, 20000, limit=3):
+        arrivals.append((result["ring"], time.monotonic() - started))
+        time.sleep(0.3)  # The caller rendering this ring
+    assert [ring for ring, _ in arrivals] == [2000, 5000]
+    assert arrivals[0][1] < 0.5
+    # The second ring was fetched while the first was being rendered
+    assert arrivals[1][1] < 0.9
+
+
+def test_emergency_only_keeps_widening_past_clinics():
+    tool = SlowTool(delay=0)
+    results = list(expanding_ring_search(tool, 0.0, 0.0, 20000, limit=2, emergency_only=True, pool=20))
+    assert [result["ring"] for result in results] == [2000, 5000, 10000]
+    assert results[-1]["final"]
+    assert all(hospital["emergency"] for hospital in results[-1]["hospitals"])
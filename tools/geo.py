@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_MILE = 1609.34
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(latitude, longitude, precision=5):
+    """Encode a coordinate as a geohash cell of ``precision`` characters."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def geohash_decode(geohash):
+    """Return ``(latitude, longitude, lat_error, lon_error)`` for the cell's center."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = _GEOHASH_BASE32.index(char)
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    lat = (lat_range[0] + lat_range[1]) / 2
+    lon = (lon_range[0] + lon_range[1]) / 2
+    return lat, lon, (lat_range[1] - lat_range[0]) / 2, (lon_range[1] - lon_range[0]) / 2
+
+
+def geohash_neighbors(geohash):
+    """Return the eight cells surrounding ``geohash`` at the same precision."""
+    lat, lon, lat_err, lon_err = geohash_decode(geohash)
+    neighbors = []
+    for d_lat in (-1, 0, 1):
+        for d_lon in (-1, 0, 1):
+            if d_lat == 0 and d_lon == 0:
+                continue
+            n_lat = max(-90.0, min(90.0, lat + d_lat * 2 * lat_err))
+            n_lon = (lon + d_lon * 2 * lon_err + 180.0) % 360.0 - 180.0
+            neighbors.append(geohash_encode(n_lat, n_lon, len(geohash)))
+    return neighbors
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    """Great-circle distance in meters between two coordinates."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def haversine_m_vec(latitude, longitude, latitudes, longitudes):
+    """Distances in meters from one coordinate to arrays of coordinates."""
+    phi1 = np.radians(latitude)
+    phi2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(np.asarray(longitudes, dtype=np.float64) - longitude)
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
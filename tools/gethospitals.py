@@ -1,9 +1,88 @@
+import asyncio
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import numpy as np
 from crewai.tools import BaseTool
 from pydantic import Field
-from serpapi import GoogleSearch
-import folium
+from services.http_pool import CONNECT_TIMEOUT, READ_TIMEOUT, http_session
+from services.resilience import call_with_resilience
+from tools.geo import METERS_PER_MILE, haversine_m_vec
+from tools.hospital_cache import HospitalSearchCache
+from tools.hospital_index import load_default_index
+
+# Local hospital data, memory-mapped once at import when configured
+local_hospital_index = load_default_index()
+
+# Shared by every tool instance in the process
+hospital_search_cache = HospitalSearchCache(
+    ttl_seconds=int(os.getenv("HOSPITAL_CACHE_TTL_SECONDS", str(24 * 3600))),
+    partial_ttl_seconds=int(os.getenv("HOSPITAL_PARTIAL_CACHE_TTL_SECONDS", "300"))
+)
+
+# Overridable so the tool can be pointed at a local fake server
+SERPAPI_URL = os.getenv("SERPAPI_BASE_URL", "https://serpapi.com").rstrip("/") + "/search.json"
+
+# SerpAPI fan-out: result pages per query, page size and concurrent requests
+SERPAPI_PAGES = int(os.getenv("HOSPITAL_SEARCH_PAGES", "2"))
+SERPAPI_PAGE_SIZE = 20
+SERPAPI_CONCURRENCY = int(os.getenv("HOSPITAL_SEARCH_CONCURRENCY", "6"))
+
+# Radii of the expanding rings used by progressive search
+RING_RADII_M = [2000, 5000, 10000, 20000, 50000, 100000]
+
+# Own pool so the fan-out is not capped by the event loop's CPU-sized default executor
+serpapi_executor = ThreadPoolExecutor(max_workers=SERPAPI_CONCURRENCY, thread_name_prefix="serpapi")
+
+
+def _serpapi_get(params):
+    response = http_session().get(SERPAPI_URL, params=params, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    response.raise_for_status()
+    return response.json()
+
+
+def serpapi_search(params):
+    """One SerpAPI request over the shared keep-alive session, with retries and a circuit breaker."""
+    return call_with_resilience("serpapi", _serpapi_get, params)
+
+
+def search_queries(specialty=None):
+    queries = ["hospitals", "emergency room"]
+    if specialty and specialty != "None":
+        queries.append(f"{specialty.lower()} hospital")
+    return queries
+
+
+def hospital_keys(hospital):
+    """Identity keys for deduplication: place id and normalized name at ~10 m precision."""
+    name = re.sub(r"[^a-z0-9]", "", hospital["name"].lower())
+    keys = {("name", name, round(hospital["latitude"], 4), round(hospital["longitude"], 4))}
+    if hospital.get("place_id"):
+        keys.add(("place", hospital["place_id"]))
+    return keys
+
+
+def format_distance(distance_m):
+    return f"{distance_m / METERS_PER_MILE:.1f} miles"
+
+
+def nearest_within_radius(latitude, longitude, hospitals, radius, limit):
+    """Keep hospitals inside ``radius`` meters, nearest first, with computed distances."""
+    if not hospitals:
+        return []
+    distances = haversine_m_vec(
+        latitude, longitude,
+        [hospital["latitude"] for hospital in hospitals],
+        [hospital["longitude"] for hospital in hospitals]
+    )
+    inside = np.flatnonzero(distances <= radius)
+    order = inside[np.argsort(distances[inside], kind="stable")][:limit]
+    return [
+        dict(hospitals[i], distance=format_distance(distances[i]), distance_m=round(float(distances[i]), 1))
+        for i in order
+    ]
+
 
 class HospitalSearchByCoordinatesTool(BaseTool):
     name: str = "Hospital Search by Coordinates"
@@ -18,6 +97,8 @@ class HospitalSearchByCoordinatesTool(BaseTool):
         longitude: float = Field(..., description="Longitude of the search center"),
         radius: int = Field(5000, description="Search radius in meters (default: 5000 = 3.1 miles)"),
         limit: int = Field(5, description="Max results to return (default: 5)"),
+        specialty: Optional[str] = Field(None, description="Optional specialty to also search for, e.g. Cardiology"),
+        emergency_only: bool = Field(False, description="Only return hospitals with emergency services"),
     ) -> dict:
         """
         Searches for hospitals using SerpAPI's Google Maps engine via coordinates.
@@ -30,55 +111,91 @@ class HospitalSearchByCoordinatesTool(BaseTool):
                         "address": "123 Main St",
                         "phone": "+1 234-567-890",
                         "distance": "2.3 miles",
+                        "distance_m": 3701.5,
                         "emergency": True,
                         "latitude": 40.7128,
-                        "longitude": -74.0060
+                        "longitude": -74.0060,
+                        "review_rating": 4.3,
+                        "reviews": 812,
+                        "type": "Hospital"
                     }
                 ],
-                "user_coordinates": [lat, lng]
+                "user_coordinates": [lat, lng],
+                "search_radius": 5000,
+                "count": 1,
+                "cached": False
             }
+        
+        When local data is configured (HOSPITAL_STORE or HOSPITAL_DATASET), hospitals are
+        looked up in its grid index first. Otherwise results are served from the
+        shared spatial cache when a previous search covers this circle, and
+        SerpAPI is queried at a padded radius bucket on a miss, with concurrent
+        general, emergency and specialty queries over several pages. Distances are
+        always computed from coordinates; hospitals outside ``radius`` are dropped.
+        With ``emergency_only``, hospitals without emergency services are dropped
+        before ``limit`` is applied.
+        Transient SerpAPI failures are retried with backoff; while SerpAPI is
+        down, an expired cached answer is returned with ``"stale": True``.
+        When only some SerpAPI requests fail, the rest are returned with
+        ``"partial": True`` and cached for HOSPITAL_PARTIAL_CACHE_TTL_SECONDS only.
         """
-        params = {
-            "engine": "google_maps",
-            "q": "hospitals",
-            "ll": f"@{latitude},{longitude},14z",  # Key change: Uses exact coordinates
-            "type": "search",
-            "radius": radius,
-            "hl": "en",
-            "api_key": os.getenv("SERP_API")  # From your .env
-        }
-
         try:
-            results = GoogleSearch(params).get_dict()
-            hospitals = []
+            if local_hospital_index is not None:
+                hospitals = [
+                    dict(record, distance=format_distance(distance), distance_m=round(distance, 1))
+                    for record, distance in local_hospital_index.nearest(
+                        latitude, longitude, radius, limit, emergency_only=emergency_only
+                    )
+                ]
+                # Fall back to SerpAPI where the dataset has no coverage
+                if hospitals:
+                    return {
+                        "hospitals": hospitals,
+                        "user_coordinates": [latitude, longitude],
+                        "search_radius": radius,
+                        "status": "success",
+                        "count": len(hospitals),
+                        "cached": True,
+                        "source": "local"
+                    }
             
-            # Validate and standardize the results
-            for place in results.get("local_results", [])[:limit]:
-                # Ensure required fields exist
-                if not all(key in place for key in ['title', 'address']):
-                    continue
-                    
-                hospital_data = {
-                    "name": place.get("title", "Unknown Hospital"),
-                    "address": place.get("address", "Address not available"),
-                    "phone": place.get("phone", ""),
-                    "distance": place.get("distance", "Distance not available"),
-                    "emergency": "emergency" in place.get("title", "").lower() or 
-                                "emergency" in place.get("description", "").lower(),
-                    "latitude": place.get("gps_coordinates", {}).get("latitude"),
-                    "longitude": place.get("gps_coordinates", {}).get("longitude")
-                }
-                
-                # Only include hospitals with coordinates
-                if hospital_data["latitude"] and hospital_data["longitude"]:
-                    hospitals.append(hospital_data)
+            # Answer from a cached area covering this circle before spending SerpAPI quota
+            queries = tuple(search_queries(specialty))
+            hospitals = hospital_search_cache.lookup(latitude, longitude, radius, queries)
+            cached = hospitals is not None
+            stale = partial = False
+            if not cached:
+                bucket = hospital_search_cache.fetch_radius(latitude, longitude, radius)
+                try:
+                    hospitals, complete = self._fetch_hospitals(latitude, longitude, bucket, specialty)
+                except Exception:
+                    # Upstream is failing (retries exhausted or circuit open): serve an
+                    # expired cached answer when there is one rather than an error
+                    hospitals = hospital_search_cache.lookup(latitude, longitude, radius, queries, allow_stale=True)
+                    if hospitals is None:
+                        raise
+                    cached = stale = True
+                else:
+                    # Some query/page requests failed: keep the partial answer only briefly
+                    partial = not complete
+                    hospital_search_cache.store(latitude, longitude, bucket, hospitals, queries, partial=partial)
+            
+            if emergency_only:
+                hospitals = [hospital for hospital in hospitals if hospital.get("emergency")]
+            # Cached and bucketed results can span more than the requested radius, and
+            # SerpAPI's own ordering/distance text is unreliable: measure, filter, then limit
+            hospitals = nearest_within_radius(latitude, longitude, hospitals, radius, limit)
             
             return {
                 "hospitals": hospitals,
                 "user_coordinates": [latitude, longitude],
                 "search_radius": radius,
                 "status": "success",
-                "count": len(hospitals)
+                "count": len(hospitals),
+                "cached": cached,
+                "stale": stale,
+                "partial": partial,
+                "source": "serpapi"
             }
 
         except Exception as e:
@@ -88,3 +205,144 @@ class HospitalSearchByCoordinatesTool(BaseTool):
                 "hospitals": [],
                 "user_coordinates": [latitude, longitude]
             }
+
+    def _fetch_hospitals(self, latitude: float, longitude: float, radius: int,
+                         specialty: Optional[str] = None) -> tuple:
+        """Runs the concurrent SerpAPI fan-out from synchronous code."""
+        coroutine = self._afetch_hospitals(latitude, longitude, radius, specialty)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # Called from inside an event loop: run ours on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def _afetch_hospitals(self, latitude: float, longitude: float, radius: int,
+                                specialty: Optional[str] = None) -> tuple:
+        """Queries SerpAPI concurrently for every valid, distinct hospital with coordinates.
+
+        Each query in ``search_queries(specialty)`` is fetched for
+        HOSPITAL_SEARCH_PAGES result pages at once, so the whole fan-out costs
+        about one round trip. Results are merged in query order and
+        deduplicated by place id, or by normalized name and coordinates.
+        Returns ``(hospitals, complete)``, where ``complete`` is False when
+        some requests failed; raises when they all did.
+        """
+        loop = asyncio.get_running_loop()
+
+        async def fetch_page(query, page):
+            params = {
+                "engine": "google_maps",
+                "q": query,
+                "ll": f"@{latitude},{longitude},14z",  # Key change: Uses exact coordinates
+                "type": "search",
+                "radius": radius,
+                "start": page * SERPAPI_PAGE_SIZE,
+                "hl": "en",
+                "api_key": os.getenv("SERP_API")  # From your .env
+            }
+            return await loop.run_in_executor(serpapi_executor, serpapi_search, params)
+
+        pages = [
+            (query, page)
+            for query in search_queries(specialty)
+            for page in range(SERPAPI_PAGES)
+        ]
+        responses = await asyncio.gather(
+            *(fetch_page(query, page) for query, page in pages), return_exceptions=True
+        )
+        failures = [response for response in responses if isinstance(response, Exception)]
+        if len(failures) == len(responses):
+            raise failures[0]
+
+        hospitals = []
+        seen = set()
+        for (query, _), results in zip(pages, responses):
+            if isinstance(results, Exception):
+                continue
+            for place in results.get("local_results", []):
+                hospital_data = self._standardize(place, query)
+                if hospital_data is None:
+                    continue
+                keys = hospital_keys(hospital_data)
+                if seen.intersection(keys):
+                    continue
+                seen.update(keys)
+                hospitals.append(hospital_data)
+        return hospitals, not failures
+
+    def _standardize(self, place: dict, query: str) -> Optional[dict]:
+        """Validates one SerpAPI local result; None when it is unusable."""
+        # Ensure required fields exist
+        if not all(key in place for key in ['title', 'address']):
+            return None
+            
+        hospital_data = {
+            "name": place.get("title", "Unknown Hospital"),
+            "address": place.get("address", "Address not available"),
+            "phone": place.get("phone", ""),
+            "emergency": "emergency" in place.get("title", "").lower() or 
+                        "emergency" in place.get("description", "").lower() or
+                        "emergency" in place.get("type", "").lower(),
+            "latitude": place.get("gps_coordinates", {}).get("latitude"),
+            "longitude": place.get("gps_coordinates", {}).get("longitude"),
+            # Google Maps review data and category, used for ranking
+            "review_rating": place.get("rating"),
+            "reviews": place.get("reviews"),
+            "type": place.get("type", ""),
+            "place_id": place.get("place_id"),
+            "query": query
+        }
+        
+        # Only include hospitals with coordinates; distance is derived from them later
+        if hospital_data["latitude"] is None or hospital_data["longitude"] is None:
+            return None
+        return hospital_data
+
+
+# Runs the next ring's search while the caller renders the current one
+ring_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hospital-ring")
+
+
+def ring_radii(radius):
+    """Ring radii up to and including ``radius`` meters."""
+    return [ring for ring in RING_RADII_M if ring < radius] + [radius]
+
+
+def expanding_ring_search(tool, latitude, longitude, radius, limit, specialty=None,
+                          emergency_only=False, pool=None):
+    """Yield search results for widening rings, nearest hospitals first.
+
+    The smallest ring is searched first so the nearest hospitals can be shown
+    right away. While the caller renders a ring, the next one is already
+    being fetched in the background. Each ring asks for up to ``pool``
+    candidates (default ``limit``), so ranking still weighs more than the
+    nearest ``limit``. With ``emergency_only`` the tool only returns
+    hospitals with emergency services, so a ring full of clinics cannot end
+    the search. Stops once a ring holds ``limit`` hospitals or the full
+    ``radius`` has been searched; the last result yielded is final.
+
+    Wider rings stay cheap: the local index answers them in memory, and on
+    the SerpAPI path a miss is fetched at a padded bucket
+    (HospitalSearchCache.fetch_radius), so the next rings are usually
+    served from that cache entry.
+    """
+    def search(ring):
+        return tool.run(latitude=latitude, longitude=longitude, radius=ring, limit=pool or limit,
+                        specialty=specialty, emergency_only=emergency_only)
+
+    rings = ring_radii(radius)
+    future = ring_executor.submit(search, rings[0])
+    for i, ring in enumerate(rings):
+        result = future.result()
+        done = (
+            result.get("status") != "success"
+            or result.get("count", 0) >= limit
+            or i == len(rings) - 1
+        )
+        if not done:
+            future = ring_executor.submit(search, rings[i + 1])
+        yield dict(result, ring=ring, final=done)
+        if done:
+            return
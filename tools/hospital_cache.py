@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+
+from tools.geo import geohash_decode, geohash_encode, geohash_neighbors, haversine_m
+
+# Radii that searches are rounded up to, so nearby queries share entries
+RADIUS_BUCKETS_M = [1000, 2000, 5000, 10000, 20000, 50000, 100000]
+
+
+def radius_bucket(radius):
+    """Smallest bucket that covers ``radius`` meters."""
+    for bucket in RADIUS_BUCKETS_M:
+        if radius <= bucket:
+            return bucket
+    return int(radius)
+
+
+class HospitalSearchCache:
+    """Spatial cache of hospital search results keyed by geohash cell, radius bucket and queries.
+
+    Each entry holds every hospital found within its bucket radius of the
+    point it was fetched for. A later query is answered from any entry in its
+    own or a neighbouring cell whose circle fully covers the query circle.
+    Partial entries (some upstream requests failed) expire after
+    ``partial_ttl_seconds`` instead, so a complete answer replaces them soon.
+    """
+
+    def __init__(self, ttl_seconds=24 * 3600, max_entries=2048, precision=5, partial_ttl_seconds=300):
+        self.ttl_seconds = ttl_seconds
+        self.partial_ttl_seconds = partial_ttl_seconds
+        self.max_entries = max_entries
+        self.precision = precision
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cell(self, latitude, longitude):
+        return geohash_encode(latitude, longitude, self.precision)
+
+    def fetch_radius(self, latitude, longitude, radius):
+        """Bucket to fetch at on a miss, so the entry also serves nearby queries.
+
+        An entry only answers queries whose whole circle lies inside its own,
+        so fetching at just ``radius`` would serve no other point. Padding by
+        the cell diagonal covers the same radius from anywhere within one
+        diagonal of this point: the whole home cell and most of its neighbours.
+        """
+        lat, lon, lat_err, lon_err = geohash_decode(self.cell(latitude, longitude))
+        diagonal = haversine_m(lat - lat_err, lon - lon_err, lat + lat_err, lon + lon_err)
+        return radius_bucket(radius + diagonal)
+
+    def lookup(self, latitude, longitude, radius, queries=(), allow_stale=False):
+        """Return cached hospitals covering the query circle, or None on a miss.
+
+        ``queries`` identifies the search terms an entry was fetched with;
+        entries only answer lookups for the same terms. ``allow_stale``
+        also accepts expired entries, as a fallback when upstream is down.
+        """
+        home = self.cell(latitude, longitude)
+        now = time.time()
+        with self._lock:
+            for cell in [home] + geohash_neighbors(home):
+                for bucket in RADIUS_BUCKETS_M + [int(radius)]:
+                    if bucket < radius:
+                        continue
+                    key = (cell, bucket, queries)
+                    entry = self._entries.get(key)
+                    if entry is None or (not allow_stale and now - entry["fetched_at"] > entry["ttl"]):
+                        continue
+                    center_lat, center_lon = entry["center"]
+                    if haversine_m(latitude, longitude, center_lat, center_lon) + radius <= bucket:
+                        self._entries.move_to_end(key)
+                        if not allow_stale:
+                            self.hits += 1
+                        return list(entry["hospitals"])
+            if not allow_stale:
+                self.misses += 1
+            return None
+
+    def store(self, latitude, longitude, bucket, hospitals, queries=(), partial=False):
+        key = (self.cell(latitude, longitude), bucket, queries)
+        with self._lock:
+            self._entries[key] = {
+                "center": (latitude, longitude),
+                "hospitals": list(hospitals),
+                "fetched_at": time.time(),
+                "partial": partial,
+                "ttl": self.partial_ttl_seconds if partial else self.ttl_seconds
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,194 @@
+import csv
+import json
+import math
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from tools.geo import EARTH_RADIUS_M, haversine_m_vec
+from tools.hospital_store import FLAG_EMERGENCY, GRID_CELL_DEGREES, HospitalStore, build_grid
+
+# Accepted column names for each field in CSV datasets
+_CSV_ALIASES = {
+    "name": ("name", "title", "hospital_name"),
+    "address": ("address", "full_address"),
+    "phone": ("phone", "telephone", "phone_number"),
+    "emergency": ("emergency", "has_emergency", "er"),
+    "latitude": ("latitude", "lat"),
+    "longitude": ("longitude", "lon", "lng")
+}
+
+
+def _parse_flag(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "y")
+
+
+def _pick(row, field):
+    for alias in _CSV_ALIASES[field]:
+        if row.get(alias) not in (None, ""):
+            return row[alias]
+    return None
+
+
+def read_csv_records(path):
+    records = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): value for key, value in row.items() if key}
+            latitude, longitude = _pick(row, "latitude"), _pick(row, "longitude")
+            if latitude is None or longitude is None:
+                continue
+            records.append({
+                "name": _pick(row, "name") or "Unknown Hospital",
+                "address": _pick(row, "address") or "Address not available",
+                "phone": _pick(row, "phone") or "",
+                "emergency": _parse_flag(_pick(row, "emergency") or False),
+                "latitude": float(latitude),
+                "longitude": float(longitude)
+            })
+    return records
+
+
+def read_geojson_records(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    records = []
+    for feature in data.get("features", []):
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") != "Point":
+            continue
+        longitude, latitude = geometry["coordinates"][:2]
+        properties = feature.get("properties") or {}
+        records.append({
+            "name": properties.get("name", "Unknown Hospital"),
+            "address": properties.get("address", "Address not available"),
+            "phone": properties.get("phone", ""),
+            "emergency": _parse_flag(properties.get("emergency", False)),
+            "latitude": float(latitude),
+            "longitude": float(longitude)
+        })
+    return records
+
+
+def read_records(path):
+    """Read hospital records from a ``.csv`` or ``.geojson``/``.json`` dataset."""
+    if Path(path).suffix.lower() == ".csv":
+        return read_csv_records(path)
+    return read_geojson_records(path)
+
+
+class HospitalIndex:
+    """Nearest-neighbour lookup over a local hospital dataset.
+
+    Records are bucketed into a fixed lat/lon grid (see
+    tools.hospital_store.build_grid), so "nearest k hospitals within r meters"
+    is answered without any network call by measuring only the records in
+    the cells the radius overlaps. Over a memory-mapped HospitalStore the grid
+    is read from the file rather than built, and records are only
+    materialized for the hits.
+    """
+
+    # Beyond this many cells a radius query just scans every record
+    MAX_QUERY_CELLS = 4096
+
+    def __init__(self, latitudes, longitudes, get_record, cell_keys, cell_starts,
+                 cell_degrees=GRID_CELL_DEGREES, flags=None):
+        self._latitudes = latitudes
+        self._longitudes = longitudes
+        self._flags = flags
+        self._get_record = get_record
+        self._cell_keys = cell_keys
+        self._cell_starts = cell_starts
+        self._cell_degrees = cell_degrees
+        self._grid_columns = int(round(360 / cell_degrees))
+        self._size = len(latitudes)
+
+    def __len__(self):
+        return self._size
+
+    @classmethod
+    def from_records(cls, records):
+        latitudes = np.array([r["latitude"] for r in records], dtype=np.float64)
+        longitudes = np.array([r["longitude"] for r in records], dtype=np.float64)
+        order, cell_keys, cell_starts = build_grid(latitudes, longitudes)
+        records = [records[i] for i in order]
+        flags = np.array([FLAG_EMERGENCY if r.get("emergency") else 0 for r in records], dtype="u1")
+        return cls(latitudes[order], longitudes[order], records.__getitem__, cell_keys, cell_starts,
+                   flags=flags)
+
+    @classmethod
+    def from_store(cls, store):
+        return cls(store.latitudes, store.longitudes, store.record,
+                   store.cell_keys, store.cell_starts, store.cell_degrees, flags=store.flags)
+
+    @classmethod
+    def load(cls, path):
+        """Load a ``.csv`` or ``.geojson``/``.json`` dataset."""
+        return cls.from_records(read_records(path))
+
+    def _query_cells(self, latitude, longitude, radius):
+        """Ids of the grid cells a ``radius``-meter circle may overlap, or None for all."""
+        d = self._cell_degrees
+        d_lat = math.degrees(radius / EARTH_RADIUS_M)
+        row_min = math.floor((max(latitude - d_lat, -90.0) + 90.0) / d)
+        row_max = math.floor((min(latitude + d_lat, 90.0) + 90.0) / d)
+        # Longitude span is widest at the row furthest from the equator
+        cos_lat = math.cos(math.radians(min(90.0, abs(latitude) + d_lat)))
+        if cos_lat < 1e-9 or d_lat / cos_lat >= 180.0:
+            cols = range(self._grid_columns)
+        else:
+            d_lon = d_lat / cos_lat
+            col_min = math.floor((longitude - d_lon + 180.0) / d)
+            col_max = math.floor((longitude + d_lon + 180.0) / d)
+            cols = {col % self._grid_columns for col in range(col_min, col_max + 1)}
+        if (row_max - row_min + 1) * len(cols) > self.MAX_QUERY_CELLS:
+            return None
+        return np.array([row * self._grid_columns + col for row in range(row_min, row_max + 1) for col in cols],
+                        dtype=np.int64)
+
+    def _candidates(self, latitude, longitude, radius):
+        cells = self._query_cells(latitude, longitude, radius)
+        if cells is None:
+            return np.arange(self._size)
+        positions = np.searchsorted(self._cell_keys, cells)
+        found = positions < len(self._cell_keys)
+        found[found] = self._cell_keys[positions[found]] == cells[found]
+        positions = positions[found]
+        ranges = [np.arange(self._cell_starts[p], self._cell_starts[p + 1]) for p in positions]
+        return np.concatenate(ranges) if ranges else np.empty(0, dtype=np.int64)
+
+    def nearest(self, latitude, longitude, radius, k, emergency_only=False):
+        """Return up to ``k`` ``(record, distance_m)`` pairs within ``radius`` meters, nearest first.
+
+        With ``emergency_only`` only hospitals with emergency services count
+        towards ``k``.
+        """
+        if not self._size:
+            return []
+        candidates = self._candidates(latitude, longitude, radius)
+        if emergency_only and self._flags is not None:
+            candidates = candidates[(self._flags[candidates] & FLAG_EMERGENCY) != 0]
+        distances = haversine_m_vec(latitude, longitude, self._latitudes[candidates], self._longitudes[candidates])
+        within = np.flatnonzero(distances <= radius)
+        nearest = within[np.argsort(distances[within], kind="stable")][:k]
+        return [(self._get_record(int(candidates[i])), float(distances[i])) for i in nearest]
+
+
+@lru_cache(maxsize=1)
+def load_default_index():
+    """Index of the configured local hospital data, or None when there is none.
+
+    A compiled store (HOSPITAL_STORE) is memory-mapped and preferred; a raw
+    CSV/GeoJSON dataset (HOSPITAL_DATASET) is parsed otherwise.
+    """
+    store_path = os.getenv("HOSPITAL_STORE")
+    if store_path and os.path.exists(store_path):
+        return HospitalIndex.from_store(HospitalStore(store_path))
+    path = os.getenv("HOSPITAL_DATASET")
+    if not path or not os.path.exists(path):
+        return None
+    return HospitalIndex.load(path)
@@ -0,0 +1,111 @@
+import itertools
+import json
+import re
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+
+class Hospital(BaseModel):
+    name: str = "Unknown Hospital"
+    address: str = "Address not available"
+    phone: str = ""
+    distance: str = ""
+    distance_m: Optional[float] = None
+    emergency: bool = False
+    latitude: float
+    longitude: float
+    review_rating: Optional[float] = None
+    reviews: Optional[int] = None
+    type: str = ""
+    place_id: Optional[str] = None
+    query: Optional[str] = None
+    specialties: List[str] = Field(default_factory=list)
+    strengths: List[str] = Field(default_factory=list)
+    score: float = 0.0
+    rating: int = Field(0, ge=0, le=5)
+
+
+class Recommendation(BaseModel):
+    name: str
+    address: str = "Address not available"
+    distance: str = ""
+    reasoning: str = ""
+    latitude: float
+    longitude: float
+
+
+class HospitalResults(BaseModel):
+    """Ranked hospital finder results, held per session for rendering."""
+    hospitals: List[Hospital] = Field(default_factory=list)
+    recommendations: List[Recommendation] = Field(default_factory=list)
+    user_coordinates: Optional[List[float]] = None
+    status: Literal["success", "error"] = "success"
+    message: Optional[str] = None
+    map_center: Optional[List[float]] = None
+    search_radius: float = 10
+
+
+class RecommendationReasons(BaseModel):
+    """LLM output for the optional reasoning step: hospital name -> reasoning."""
+    reasons: Dict[str, str] = Field(default_factory=dict)
+
+
+_JSON_OPEN = re.compile(r"[\[{]")
+_decoder = json.JSONDecoder()
+
+
+def iter_json(text):
+    """Yield each JSON object or array embedded in ``text``, in order.
+
+    Each opening bracket starts a candidate that is decoded in place, so
+    prose, Markdown fences or trailing commentary around the JSON are
+    ignored. A decoded value is skipped past whole. A failed candidate
+    resumes just after its opening bracket, so a stray bracket or quote in
+    the prose cannot hide the JSON after it. The decoder stops at the first
+    invalid token, so prose costs about one pass; only text with many
+    brackets that never close is rescanned.
+    """
+    if not text:
+        return
+    position = 0
+    while True:
+        match = _JSON_OPEN.search(text, position)
+        if match is None:
+            return
+        start = match.start()
+        try:
+            value, end = _decoder.raw_decode(text, start)
+        except (ValueError, RecursionError):
+            # RecursionError: nesting deeper than the decoder can follow
+            position = start + 1
+        else:
+            yield value
+            position = end
+
+
+def extract_json(text):
+    """Return the first complete JSON object or array embedded in ``text``, or None."""
+    return next(iter_json(text), None)
+
+
+def parse_model(model, output):
+    """Validate a crew task output (pydantic/json_dict/raw text) into ``model``, or None.
+
+    ``json_dict`` is tried first, then every JSON value embedded in the raw
+    text in turn, so a bracketed aside such as "see [1]" before the real
+    object, or a ``json_dict`` of the wrong shape, does not hide it.
+    """
+    if output is None:
+        return None
+    if isinstance(getattr(output, "pydantic", None), model):
+        return output.pydantic
+    json_dict = getattr(output, "json_dict", None)
+    raw = getattr(output, "raw", output)
+    candidates = iter_json(raw if isinstance(raw, str) else None)
+    for data in itertools.chain([json_dict] if json_dict else [], candidates):
+        try:
+            return model.model_validate(data)
+        except ValidationError:
+            continue
+    return None
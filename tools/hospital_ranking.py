@@ -0,0 +1,213 @@
+import math
+import os
+import re
+
+import numpy as np
+
+from tools.geo import METERS_PER_MILE, haversine_m_vec
+from tools.hospital_models import HospitalResults
+
+# Relative importance of each signal; only the active ones are renormalized to 1
+DEFAULT_WEIGHTS = {
+    "distance": 0.4,
+    "emergency": 0.25,
+    "specialty": 0.2,
+    "rating": 0.15
+}
+
+# Words in a hospital's name/type/description (or the query that found it) that indicate a specialty
+SPECIALTY_KEYWORDS = {
+    "Cardiology": ("cardio", "heart", "cardiac"),
+    "Pediatrics": ("pediatric", "paediatric", "children", "child", "kids"),
+    "Trauma": ("trauma", "accident", "emergency"),
+    "Oncology": ("oncology", "cancer", "tumor", "tumour"),
+    "Neurology": ("neuro", "brain", "stroke", "spine")
+}
+
+# Ratings assumed for hospitals without reviews, on SerpAPI's 0-5 scale
+NEUTRAL_RATING = 3.0
+
+
+def load_weights():
+    """Ranking weights, overridable with e.g. HOSPITAL_RANK_WEIGHTS="distance=0.5,rating=0.3"."""
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in os.getenv("HOSPITAL_RANK_WEIGHTS", "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() in weights and value.strip():
+            weights[name.strip()] = float(value)
+    return weights
+
+
+def normalize_phone(phone, country_code=None):
+    """Normalize a phone number to E.164 (``+<digits>``) where the country is known.
+
+    Numbers without an international prefix get ``country_code`` (or
+    DEFAULT_PHONE_COUNTRY_CODE) prepended, unless they already start with
+    it. Without a country code the number is returned as listed, since its
+    local formatting is easier to read than bare digits.
+    """
+    if not phone:
+        return ""
+    phone = str(phone).strip()
+    digits = re.sub(r"\D", "", phone)
+    if not digits:
+        return ""
+    if phone.startswith("+"):
+        return f"+{digits}"
+    if digits.startswith("00"):
+        return f"+{digits[2:]}"
+    country_code = country_code or os.getenv("DEFAULT_PHONE_COUNTRY_CODE", "")
+    country_code = re.sub(r"\D", "", country_code)
+    if not country_code:
+        return phone
+    # "1 (555) 123-4567" already carries the code; a national number has at least 7 digits after it
+    if digits.startswith(country_code) and len(digits) - len(country_code) >= 7:
+        return f"+{digits}"
+    return f"+{country_code}{digits.lstrip('0')}"
+
+
+def infer_specialties(hospital):
+    text = " ".join(
+        str(hospital.get(field) or "") for field in ("name", "type", "description", "query")
+    ).lower()
+    specialties = [
+        specialty for specialty, keywords in SPECIALTY_KEYWORDS.items()
+        if any(keyword in text for keyword in keywords)
+    ]
+    return specialties or ["General Medicine"]
+
+
+def score_hospitals(hospitals, user_coordinates, radius_m, specialty=None, weights=None):
+    """Weighted score in [0, 1] for every hospital, computed in one pass over arrays.
+
+    Signals: closeness within ``radius_m``, emergency service, a match on the
+    requested ``specialty`` and the review rating. The specialty weight only
+    counts when a specialty was requested.
+    """
+    weights = dict(weights or load_weights())
+    if not specialty:
+        weights["specialty"] = 0.0
+    total = sum(weights.values()) or 1.0
+
+    latitude, longitude = user_coordinates
+    distances = np.array([
+        hospital["distance_m"] if hospital.get("distance_m") is not None else np.nan
+        for hospital in hospitals
+    ], dtype=np.float64)
+    missing = np.isnan(distances)
+    if missing.any():
+        distances[missing] = haversine_m_vec(
+            latitude, longitude,
+            [hospitals[i]["latitude"] for i in np.flatnonzero(missing)],
+            [hospitals[i]["longitude"] for i in np.flatnonzero(missing)]
+        )
+    ratings = np.array([
+        hospital["review_rating"] if hospital.get("review_rating") is not None else NEUTRAL_RATING
+        for hospital in hospitals
+    ], dtype=np.float64)
+    emergency = np.array([bool(hospital.get("emergency")) for hospital in hospitals], dtype=np.float64)
+    specialty_match = np.array([
+        specialty in hospital["specialties"] for hospital in hospitals
+    ], dtype=np.float64)
+
+    closeness = np.clip(1.0 - distances / max(radius_m, 1), 0.0, 1.0)
+    scores = (
+        weights["distance"] * closeness
+        + weights["emergency"] * emergency
+        + weights["specialty"] * specialty_match
+        + weights["rating"] * np.clip(ratings / 5.0, 0.0, 1.0)
+    ) / total
+    return scores, distances
+
+
+def _strengths(hospital, specialty, closest):
+    strengths = []
+    if hospital.get("emergency"):
+        strengths.append("Emergency services available")
+    if closest:
+        strengths.append("Closest option to your location")
+    if hospital.get("review_rating") is not None:
+        reviews = f" from {hospital['reviews']} reviews" if hospital.get("reviews") else ""
+        strengths.append(f"Rated {hospital['review_rating']:.1f}/5{reviews}")
+    if specialty and specialty in hospital["specialties"]:
+        strengths.append(f"Offers {specialty}")
+    return strengths
+
+
+def recommendation_reasoning(hospital, specialty=None):
+    """Short, deterministic explanation of why a hospital was recommended."""
+    parts = [f"{hospital['distance']} away"]
+    if hospital.get("emergency"):
+        parts.append("has emergency services")
+    if specialty and specialty in hospital["specialties"]:
+        parts.append(f"matches your {specialty} need")
+    if hospital.get("review_rating") is not None:
+        parts.append(f"rated {hospital['review_rating']:.1f}/5 by patients")
+    reasoning = "; ".join(parts)
+    return reasoning[0].upper() + reasoning[1:] + "."
+
+
+def build_recommendations(search_result, radius_miles, specialty=None, emergency_only=False,
+                          limit=None, top_n=3, weights=None):
+    """Rank a HospitalSearchByCoordinatesTool result into validated HospitalResults."""
+    user_coordinates = search_result.get("user_coordinates")
+    if search_result.get("status") != "success":
+        return HospitalResults.model_validate({
+            "status": "error",
+            "message": search_result.get("message", "Hospital search failed"),
+            "hospitals": [],
+            "recommendations": [],
+            "user_coordinates": user_coordinates,
+            "map_center": user_coordinates,
+            "search_radius": radius_miles
+        })
+
+    specialty = None if specialty in (None, "", "None") else specialty
+    hospitals = []
+    for hospital in search_result.get("hospitals", []):
+        if emergency_only and not hospital.get("emergency"):
+            continue
+        hospital = dict(hospital, phone=normalize_phone(hospital.get("phone")))
+        hospital["specialties"] = infer_specialties(hospital)
+        hospitals.append(hospital)
+
+    if hospitals:
+        scores, distances = score_hospitals(
+            hospitals, user_coordinates, radius_miles * METERS_PER_MILE, specialty, weights
+        )
+        # Highest score first, nearer hospital on ties
+        order = np.lexsort((distances, -scores))
+        closest = int(np.argmin(distances))
+        ranked = []
+        for i in order:
+            hospital = hospitals[i]
+            hospital["distance_m"] = round(float(distances[i]), 1)
+            hospital.setdefault("distance", f"{distances[i] / METERS_PER_MILE:.1f} miles")
+            hospital["score"] = round(float(scores[i]), 3)
+            # Star rating for display: the review rating when there is one, else the score
+            stars = hospital["review_rating"] if hospital.get("review_rating") is not None else 1 + 4 * scores[i]
+            # Round halves up (round() would send 4.5 to 4)
+            hospital["rating"] = int(min(5, max(1, math.floor(stars + 0.5))))
+            hospital["strengths"] = _strengths(hospital, specialty, i == closest)
+            ranked.append(hospital)
+        hospitals = ranked[:limit] if limit else ranked
+
+    recommendations = [
+        {
+            "name": hospital["name"],
+            "address": hospital["address"],
+            "distance": hospital["distance"],
+            "reasoning": recommendation_reasoning(hospital, specialty),
+            "latitude": hospital["latitude"],
+            "longitude": hospital["longitude"]
+        }
+        for hospital in hospitals[:top_n]
+    ]
+    return HospitalResults.model_validate({
+        "hospitals": hospitals,
+        "recommendations": recommendations,
+        "user_coordinates": user_coordinates,
+        "status": "success",
+        "map_center": user_coordinates,
+        "search_radius": radius_miles
+    })
@@ -0,0 +1,165 @@
+"""Compact columnar hospital store that is memory-mapped at startup.
+
+Layout: an 8-byte magic, a little-endian uint32 header length, a JSON header
+describing each column (dtype, offset, length), then the column data, each
+aligned to 64 bytes. Columns are latitude/longitude (float64), flags (uint8,
+bit 0 = emergency) and, for name/address/phone, uint32 offsets into one UTF-8
+string table.
+
+Records are sorted by a fixed lat/lon grid cell, and the spatial index is
+stored with them: ``cell_keys`` (sorted cell ids) and ``cell_starts`` (the
+first record of each cell). A radius query looks up the few cells it
+overlaps and reads only those records. Because the file is opened with
+``np.memmap``, worker processes share its pages and neither startup cost nor
+memory grows with the dataset.
+
+Build a store from a CSV or GeoJSON dataset with::
+
+    python -m tools.hospital_store hospitals.csv hospitals.hstore
+"""
+import json
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"HOSPSTR2"
+ALIGNMENT = 64
+FLAG_EMERGENCY = 1
+STRING_FIELDS = ("name", "address", "phone")
+# Grid cell size of the spatial index (about 5.5 km of latitude)
+GRID_CELL_DEGREES = 0.05
+
+
+def grid_cells(latitudes, longitudes, cell_degrees=GRID_CELL_DEGREES):
+    """Grid cell id (row-major over a global lat/lon grid) of each coordinate."""
+    columns = int(round(360 / cell_degrees))
+    rows = np.floor((np.asarray(latitudes, dtype=np.float64) + 90.0) / cell_degrees).astype(np.int64)
+    cols = np.floor((np.asarray(longitudes, dtype=np.float64) + 180.0) / cell_degrees).astype(np.int64) % columns
+    return rows * columns + cols
+
+
+def build_grid(latitudes, longitudes, cell_degrees=GRID_CELL_DEGREES):
+    """Return ``(order, cell_keys, cell_starts)`` for a grid index over the coordinates.
+
+    ``order`` sorts the records by cell. In that order, the records of
+    ``cell_keys[j]`` are ``cell_starts[j]:cell_starts[j + 1]``.
+    """
+    cells = grid_cells(latitudes, longitudes, cell_degrees)
+    order = np.argsort(cells, kind="stable")
+    cell_keys, starts = np.unique(cells[order], return_index=True)
+    cell_starts = np.append(starts, len(cells)).astype("<u4")
+    return order, cell_keys.astype("<i8"), cell_starts
+
+
+def compile_hospital_store(records, dest, cell_degrees=GRID_CELL_DEGREES):
+    """Write ``records`` (dicts as produced by tools.hospital_index readers) to ``dest``."""
+    count = len(records)
+    order, cell_keys, cell_starts = build_grid(
+        [r["latitude"] for r in records], [r["longitude"] for r in records], cell_degrees
+    )
+    records = [records[i] for i in order]
+    columns = {
+        "latitude": np.array([r["latitude"] for r in records], dtype="<f8"),
+        "longitude": np.array([r["longitude"] for r in records], dtype="<f8"),
+        "flags": np.array([FLAG_EMERGENCY if r.get("emergency") else 0 for r in records], dtype="u1")
+    }
+    strings = bytearray()
+    for field in STRING_FIELDS:
+        offsets = np.zeros(count + 1, dtype="<u4")
+        # All fields share one string table, so each field's offsets start where the last ended
+        offsets[0] = len(strings)
+        for i, record in enumerate(records):
+            strings += str(record.get(field) or "").encode("utf-8")
+            offsets[i + 1] = len(strings)
+        columns[f"{field}_offsets"] = offsets
+    columns["strings"] = np.frombuffer(bytes(strings), dtype="u1")
+    columns["cell_keys"] = cell_keys
+    columns["cell_starts"] = cell_starts
+
+    # Lay out the data section, then write header + aligned columns
+    layout = {}
+    position = 0
+    for name, array in columns.items():
+        position = -(-position // ALIGNMENT) * ALIGNMENT
+        layout[name] = {"dtype": array.dtype.str, "offset": position, "length": int(array.size)}
+        position += array.nbytes
+    header = json.dumps({"count": count, "cell_degrees": cell_degrees, "columns": layout}).encode("utf-8")
+    data_start = -(-(len(MAGIC) + 4 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    with open(dest, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for name, array in columns.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(array.tobytes())
+        # Trailing empty columns must still lie inside the file
+        f.truncate(data_start + position)
+    return count
+
+
+class HospitalStore:
+    """Read-only, memory-mapped view of a compiled hospital store."""
+
+    def __init__(self, path):
+        self.path = path
+        self._map = np.memmap(path, dtype="u1", mode="r")
+        if bytes(self._map[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a hospital store (or was built by an older version; rebuild it)")
+        (header_length,) = struct.unpack("<I", bytes(self._map[len(MAGIC):len(MAGIC) + 4]))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(self._map[header_start:header_start + header_length]))
+        data_start = -(-(header_start + header_length) // ALIGNMENT) * ALIGNMENT
+
+        self.count = header["count"]
+        self._columns = {}
+        for name, spec in header["columns"].items():
+            self._columns[name] = np.frombuffer(
+                self._map, dtype=np.dtype(spec["dtype"]), count=spec["length"],
+                offset=data_start + spec["offset"]
+            )
+        self.latitudes = self._columns["latitude"]
+        self.longitudes = self._columns["longitude"]
+        self.flags = self._columns["flags"]
+        self.cell_degrees = header["cell_degrees"]
+        self.cell_keys = self._columns["cell_keys"]
+        self.cell_starts = self._columns["cell_starts"]
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def emergency(self):
+        return (self.flags & FLAG_EMERGENCY).astype(bool)
+
+    def _string(self, field, i):
+        offsets = self._columns[f"{field}_offsets"]
+        return bytes(self._columns["strings"][offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def record(self, i):
+        """Materialize record ``i`` in the same shape the dataset readers produce."""
+        return {
+            "name": self._string("name", i) or "Unknown Hospital",
+            "address": self._string("address", i) or "Address not available",
+            "phone": self._string("phone", i),
+            "emergency": bool(self.flags[i] & FLAG_EMERGENCY),
+            "latitude": float(self.latitudes[i]),
+            "longitude": float(self.longitudes[i])
+        }
+
+
+def main(argv=None):
+    from tools.hospital_index import read_records
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("usage: python -m tools.hospital_store SOURCE(.csv|.geojson) DEST")
+        return 2
+    count = compile_hospital_store(read_records(argv[0]), argv[1])
+    print(f"Wrote {count} hospitals to {argv[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
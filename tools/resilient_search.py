@@ -0,0 +1,21 @@
+from typing import Any
+
+from crewai_tools import SerperDevTool
+
+from services.resilience import CircuitOpenError, call_with_resilience
+
+
+class ResilientSerperDevTool(SerperDevTool):
+    """SerperDevTool with retries, backoff and a circuit breaker.
+
+    Transient Serper failures are retried with jittered backoff instead of
+    surfacing to the agent. When Serper keeps failing, the agent gets a
+    short "unavailable" observation immediately, so it can move on without
+    spending its iterations on a dead endpoint.
+    """
+
+    def _run(self, **kwargs: Any) -> Any:
+        try:
+            return call_with_resilience("serper", super()._run, **kwargs)
+        except CircuitOpenError:
+            return "Web search is temporarily unavailable. Continue with the information you already have."
@@ -0,0 +1,194 @@
+import re
+import time
+from datetime import datetime
+
+import streamlit as st
+
+# Consultation crew steps in execution order: (key, label, dependencies)
+CONSULTATION_STEPS = [
+    ("diagnosis", "Primary diagnosis", []),
+    ("specialist", "Specialist review", ["diagnosis"]),
+    ("treatment", "Treatment plan", ["diagnosis", "specialist"]),
+    ("med_safety", "Medication safety", ["treatment"]),
+    ("research", "Medical research", ["treatment"]),
+    ("patient_education", "Patient education", ["treatment"]),
+    ("safety", "Safety assessment", ["med_safety", "research", "patient_education"])
+]
+
+# Result cards shown for a consultation: (key, title, background, border)
+CONSULTATION_SECTIONS = [
+    ("diagnosis", "🔍 Diagnosis", "#f8f9fa", "#3498db"),
+    ("treatment", "💊 Treatment Plan", "#e8f4f8", "#2ecc71"),
+    ("research", "📚 Supporting Medical Research", "#f0f7ee", "#27ae60"),
+    ("safety", "⚠️ Important Alerts", "#fde9e8", "#e74c3c"),
+    ("patient_education", "📋 Patient Education", "#e8f4fd", "#3498db")
+]
+
+# New Consultation form fields and their initial values; the saved draft starts from these
+CONSULTATION_FORM_DEFAULTS = {
+    "patient_name": "", "gender": "Male", "age": 35, "weight_kg": 70,
+    "symptoms": "", "symptom_duration": "", "medical_history": "", "family_history": "",
+    "medications": "", "allergies": "",
+    "temperature": 37.0, "heart_rate": 75, "sys_bp": 120, "dia_bp": 80,
+    "respiratory_rate": 16, "oxygen_saturation": 98, "pain_level": 0,
+    "hb": 14.0, "wbc": 7.5, "platelets": 250, "glucose": 100, "creatinine": 1.0, "bun": 15,
+    "sodium": 140, "potassium": 4.0, "chloride": 100, "additional_labs": "",
+    "lifestyle": "", "occupation": "", "recent_travel": "", "exposure_history": "", "additional_notes": ""
+}
+
+# Function to display real per-task status of a running consultation job
+def render_task_status(job):
+    started = job.started_at or job.submitted_at
+    st.progress(len(job.steps) / len(CONSULTATION_STEPS))
+    
+    lines = []
+    for key, label, deps in CONSULTATION_STEPS:
+        step = job.steps.get(key)
+        # A task becomes ready when the last of its dependencies finishes
+        dep_times = [job.steps[d]["finished_at"] for d in deps if d in job.steps]
+        ready_at = max(dep_times) if dep_times else started
+        if step:
+            lines.append(f"- ✅ **{label}** done in {step['finished_at'] - ready_at:.0f}s "
+                         f"(at {step['finished_at'] - started:.0f}s)")
+        elif job.active and len(dep_times) == len(deps):
+            lines.append(f"- ⏳ **{label}** running for {time.time() - ready_at:.0f}s")
+        else:
+            lines.append(f"- ⏸️ {label} waiting")
+    st.markdown("\n".join(lines))
+
+# Function to display tokens streamed by tasks that are still running
+def render_live_output(job):
+    for key, label, _ in CONSULTATION_STEPS:
+        buffer = job.live.get(key)
+        if buffer is not None and key not in job.steps and buffer.updated_at:
+            with st.expander(f"✍️ {label} (live)", expanded=True):
+                st.markdown(buffer.tail())
+
+# Function to display consultation result cards that have content
+def render_consultation_sections(parsed_results):
+    for key, title, bg_color, border_color in CONSULTATION_SECTIONS:
+        if key in parsed_results and parsed_results[key]:
+            with st.container():
+                st.markdown(f"""
+                <div class="card" style="background-color: {bg_color}; border-left: 5px solid {border_color};">
+                    <h3 style="color: #2c3e50;">{title}</h3>
+                    <div style="padding: 10px;">
+                """, unsafe_allow_html=True)
+                st.markdown(parsed_results[key])
+                st.markdown("</div></div>", unsafe_allow_html=True)
+
+# Function to publish a task output to the run's results bus
+def save_task_output(results_bus, run_id, task_name, output):
+    # Task callbacks can fire from crew worker threads (parallel branches),
+    # where st.session_state is not available, so outputs go to the bus.
+    output_str = str(output)
+    results_bus.publish(run_id, task_name, output_str)
+    # Ensure alerts are properly captured if they exist in the output
+    if "## ALERTS" in output_str:
+        results_bus.publish(run_id, "alerts", output_str)
+
+# Function to generate prescription document
+def generate_prescription(patient_name, gender, age, diagnosis, medications, doctor_name="AI Doctor Assistant"):
+    prescription = f"""
+    <div style="width: 800px; padding: 20px; border: 2px solid #3498db; border-radius: 10px; font-family: Arial, sans-serif;">
+        <div style="display: flex; justify-content: space-between; margin-bottom: 20px;">
+            <div>
+                <h2 style="color: #3498db; margin: 0;">MediAssist AI Clinic</h2>
+                <p style="margin: 5px 0;">123 Healthcare Avenue</p>
+                <p style="margin: 5px 0;">Medical District, MD 12345</p>
+                <p style="margin: 5px 0;">Phone: (555) 123-4567</p>
+            </div>
+            <div>
+                <h2 style="color: #3498db; text-align: right;">PRESCRIPTION</h2>
+                <p style="text-align: right; margin: 5px 0;">Date: {datetime.now().strftime('%B %d, %Y')}</p>
+                <p style="text-align: right; margin: 5px 0;">Rx #: {int(time.time())}</p>
+            </div>
+        </div>
+        
+        <div style="padding: 10px; background-color: #f8f9fa; border-radius: 5px; margin-bottom: 20px;">
+            <h3 style="margin: 0 0 10px 0; color: #2c3e50;">Patient Information</h3>
+            <table style="width: 100%; border-collapse: collapse;">
+                <tr>
+                    <td style="padding: 5px; width: 25%;"><strong>Name:</strong></td>
+                    <td style="padding: 5px;">{patient_name}</td>
+                    <td style="padding: 5px; width: 25%;"><strong>Gender:</strong></td>
+                    <td style="padding: 5px;">{gender}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 5px;"><strong>Age:</strong></td>
+                    <td style="padding: 5px;">{age} years</td>
+                    <td style="padding: 5px;"><strong>Date:</strong></td>
+                    <td style="padding: 5px;">{datetime.now().strftime('%m/%d/%Y')}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 5px;"><strong>Diagnosis:</strong></td>
+                    <td style="padding: 5px;" colspan="3">{diagnosis}</td>
+                </tr>
+            </table>
+        </div>
+        
+        <div style="margin-bottom: 20px;">
+            <h3 style="margin: 0 0 10px 0; color: #2c3e50;">Rx</h3>
+            <div style="border-left: 3px solid #3498db; padding-left: 15px;">
+    """
+    
+    # Add medications
+    if isinstance(medications, list):
+        for med in medications:
+            prescription += f"""
+                <p style="margin: 10px 0;">{med}</p>
+                <hr style="border-top: 1px dashed #ddd; margin: 10px 0;">
+            """
+    else:
+        prescription += f"""
+            <p style="margin: 10px 0;">{medications}</p>
+        """
+    
+    prescription += f"""
+            </div>
+        </div>
+        
+        <div style="display: flex; justify-content: space-between; margin-top: 40px;">
+            <div>
+                <p style="border-top: 1px solid #2c3e50; padding-top: 5px; width: 200px;">Physician Signature</p>
+                <p><strong>Dr. {doctor_name}</strong></p>
+                <p>License #: AI-MD-12345</p>
+            </div>
+            <div>
+                <p style="text-align: right; font-style: italic; color: #7f8c8d;">This prescription was generated with AI assistance.</p>
+                <p style="text-align: right; font-style: italic; color: #7f8c8d;">Please consult with a licensed healthcare provider.</p>
+            </div>
+        </div>
+    </div>
+    """
+    
+    return prescription
+
+# Extract medications from treatment plan
+def extract_medications(treatment_text):
+    medications = []
+    
+    # Look for medication patterns
+    med_patterns = [
+        r"(\d+\.\s*[A-Za-z]+\s+\d+\s*mg\s*[a-zA-Z0-9\s,]+)",
+        r"([A-Za-z]+\s+\d+\s*mg\s*[a-zA-Z0-9\s,]+)",
+        r"(Prescribe\s+[A-Za-z]+\s+\d+\s*mg\s*[a-zA-Z0-9\s,]+)"
+    ]
+    
+    for pattern in med_patterns:
+        matches = re.findall(pattern, treatment_text)
+        if matches:
+            medications.extend(matches)
+    
+    # If no structured medications found, look for bullet points or numbered lists
+    if not medications:
+        lines = treatment_text.split("\n")
+        for line in lines:
+            if ("mg" in line or "tablet" in line or "capsule" in line) and ("take" in line.lower() or "daily" in line.lower() or "twice" in line.lower()):
+                medications.append(line.strip())
+    
+    # If still no medications found, return placeholder
+    if not medications:
+        return ["Medications to be determined by physician based on final diagnosis."]
+    
+    return medications
@@ -0,0 +1,31 @@
+# Knowledge search sections and the exact headers the synthesizer writes
+KNOWLEDGE_SECTION_HEADERS = {
+    "definition": "DEFINITION",
+    "clinical_presentation": "CLINICAL PRESENTATION",
+    "diagnostic_approach": "DIAGNOSTIC APPROACH",
+    "treatment_options": "TREATMENT OPTIONS",
+    "recent_advances": "RECENT ADVANCES",
+    "references": "REFERENCES"
+}
+
+# Function to parse sections from a knowledge search result
+def parse_knowledge_sections(content):
+    sections = {key: "" for key in KNOWLEDGE_SECTION_HEADERS}
+    
+    if not isinstance(content, str):
+        content = str(content)
+    
+    # Locate every known header, then slice the text between consecutive ones.
+    # This works for partial results (e.g. refreshed sections) in any order.
+    found = []
+    for key, header in KNOWLEDGE_SECTION_HEADERS.items():
+        position = content.find(f"## {header}:")
+        if position != -1:
+            found.append((position, key, len(header) + 4))
+    found.sort()
+    
+    for i, (position, key, header_length) in enumerate(found):
+        end = found[i + 1][0] if i + 1 < len(found) else len(content)
+        sections[key] = content[position + header_length:end].strip()
+    
+    return sections
@@ -0,0 +1,248 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from dotenv import load_dotenv
+
+from services.registry import get_llm_cache
+
+logger = logging.getLogger("mediassist.pages")
+
+# Load environment variables
+load_dotenv()
+os.environ["SERPER_API_KEY"] = os.getenv("SERPER_API_KEY")
+os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
+
+# Function to load and display logo
+def load_logo():
+    return "https://img.icons8.com/color/96/000000/caduceus.png"
+# Function for page styling
+def apply_custom_styling():
+    st.markdown("""
+    <style>
+    .main-header {
+        font-family: 'Helvetica Neue', sans-serif;
+        color: #2c3e50;
+        text-align: center;
+        font-size: 2.5em;
+        margin-bottom: 0.5em;
+    }
+    .sub-header {
+        font-family: 'Helvetica Neue', sans-serif;
+        color: #3498db;
+        text-align: center;
+        font-size: 1.5em;
+        margin-bottom: 1.5em;
+    }
+    .diagnosis-box {
+        background-color: #f8f9fa;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin-bottom: 1em;
+    }
+    .treatment-box {
+        background-color: #e8f4f8;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin-bottom: 1em;
+    }
+    .research-box {
+        background-color: #f0f7ee;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin-bottom: 1em;
+    }
+    .alert-box {
+        background-color: #fde9e8;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        border-left: 5px solid #e74c3c;
+        margin-bottom: 1em;
+    }
+    .info-box {
+        background-color: #e8f4fd;
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        border-left: 5px solid #3498db;
+        margin-bottom: 1em;
+    }
+    .note-box {
+        background-color: #fef9e7;
+        border-radius: 10px;
+        padding: 15px;
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+        border-left: 3px solid #f1c40f;
+        font-size: 0.9em;
+        margin-bottom: 1em;
+    }
+    .stButton>button {
+        background-color: #3498db;
+        color: white;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-weight: bold;
+        border: none;
+        width: 100%;
+        transition: all 0.3s ease;
+    }
+    .stButton>button:hover {
+        background-color: #2980b9;
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
+    }
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 10px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        background-color: #f0f2f6;
+        border-radius: 5px 5px 0 0;
+        padding: 10px 20px;
+        height: 60px;
+    }
+    .stTabs [aria-selected="true"] {
+        background-color: #3498db !important;
+        color: white !important;
+    }
+    div[data-testid="stExpander"] div[role="button"] p {
+        font-size: 1.05em;
+        font-weight: 500;
+    }
+    .sidebar-content {
+        padding: 15px;
+    }
+    .highlight-text {
+        color: #3498db;
+        font-weight: 600;
+    }
+    .card {
+        border-radius: 10px;
+        padding: 15px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin-bottom: 20px;
+        background-color: white;
+        transition: transform 0.3s ease;
+        color: #333333;  /* Dark text color for better readability */
+        min-height: 100px;
+        border: 1px solid #e0e0e0;
+    }
+    .card:hover {
+        transform: translateY(-3px);
+        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
+    }
+    .card h3 {
+        color: #2c3e50;
+        margin-top: 0;
+        padding-bottom: 10px;
+        border-bottom: 1px solid #eee;
+    }
+
+    .card h4 {
+        color: #3498db;
+        margin-top: 0;
+    }
+    .card p {
+        margin-bottom: 0;
+    }
+    .markdown-text-container {
+        color: #333333 !important;
+    }
+    .metric-card {
+        background-color: white;
+        border-radius: 10px;
+        padding: 15px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        text-align: center;
+        transition: transform 0.3s ease;
+    }
+    .metric-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
+    }
+    .stMarkdown {
+        color: #333333 !important;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+hide_footer_style = """
+    <style>
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    
+    /* This targets GitHub icon in the footer */
+    .st-emotion-cache-1y4p8pa.ea3mdgi1 {
+        display: none !important;
+    }
+
+    /* This targets the entire footer area */
+    .st-emotion-cache-164nlkn {
+        display: none !important;
+    }
+    </style>
+"""
+
+# Function to set up the shared page chrome; every page calls it first
+def setup_page():
+    # Streamlit UI Configuration
+    st.set_page_config(
+        page_title="MediAssist AI", 
+        layout="wide", 
+        page_icon="🩺"
+    )
+    st.markdown(hide_footer_style, unsafe_allow_html=True)
+    apply_custom_styling()
+    
+    # Initialize session state variables if they don't exist
+    if 'past_consultations' not in st.session_state:
+        st.session_state.past_consultations = []
+    if 'recorded_jobs' not in st.session_state:
+        st.session_state.recorded_jobs = set()
+    
+    # Sidebar
+    with st.sidebar:
+        st.image(load_logo(), width=100)
+        st.title("MediAssist AI")
+        st.markdown("**Advanced Healthcare Intelligence Platform**")
+        st.divider()
+    
+        st.divider()
+        st.markdown("## Features")
+        st.markdown("✅ Multi-Agent Medical Intelligence")
+        st.markdown("✅ Comprehensive Diagnostic Support")
+        st.markdown("✅ Evidence-Based Treatment Plans")
+        st.markdown("✅ Medical Literature Integration")
+        st.markdown("✅ Patient Education Materials")
+        st.markdown("✅ Medication Safety Analysis")
+    
+        llm_cache = get_llm_cache()
+        if llm_cache is not None:
+            cache_stats = llm_cache.stats()
+            st.caption(f"LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                       f"({cache_stats['entries']} stored responses)")
+    
+        st.divider()
+        st.markdown("*Disclaimer: This tool is for informational purposes only and does not replace professional medical advice.*")
+
+# Function to time one run of a page script. Set PAGE_PROFILE=1 to also show
+# the previous run's time in the sidebar; timings are always logged.
+@contextmanager
+def profile_page(name):
+    if os.getenv("PAGE_PROFILE", "").lower() in ("1", "true", "yes"):
+        last = st.session_state.get("page_timings", {}).get(name)
+        if last is not None:
+            st.sidebar.caption(f"⏱ {name}: last run {last:.0f} ms")
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        st.session_state.setdefault("page_timings", {})[name] = elapsed_ms
+        logger.info("page %s ran in %.0f ms", name, elapsed_ms)